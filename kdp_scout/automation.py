@@ -306,33 +306,35 @@ class DailyAutomation:
         total_new = 0
         total_mined = 0
 
-        for seed_data in seeds:
-            keyword = seed_data['keyword']
-            department = seed_data.get('department', 'kindle')
-
-            try:
-                result = mine_keywords(
-                    keyword,
-                    depth=1,
-                    department=department,
-                )
-                total_new += result['new_count']
-                total_mined += result['total_mined']
+        # Save mined-state once at the end rather than after every seed
+        with self._seed_mgr.batch():
+            for seed_data in seeds:
+                keyword = seed_data['keyword']
+                department = seed_data.get('department', 'kindle')
+
+                try:
+                    result = mine_keywords(
+                        keyword,
+                        depth=1,
+                        department=department,
+                    )
+                    total_new += result['new_count']
+                    total_mined += result['total_mined']
 
-                # Mark as mined
-                self._seed_mgr.mark_mined(keyword)
+                    # Mark as mined
+                    self._seed_mgr.mark_mined(keyword)
 
-                if not quiet:
-                    console.print(
-                        f'  [dim]{keyword}:[/dim] '
-                        f'{result["new_count"]} new, '
-                        f'{result["total_mined"]} total'
-                    )
+                    if not quiet:
+                        console.print(
+                            f'  [dim]{keyword}:[/dim] '
+                            f'{result["new_count"]} new, '
+                            f'{result["total_mined"]} total'
+                        )
 
-            except Exception as e:
-                logger.error(f'Failed to mine seed "{keyword}": {e}')
-                if not quiet:
-                    console.print(f'  [red]{keyword}: Error - {e}[/red]')
+                except Exception as e:
+                    logger.error(f'Failed to mine seed "{keyword}": {e}')
+                    if not quiet:
+                        console.print(f'  [red]{keyword}: Error - {e}[/red]')
 
         if not quiet:
             console.print(
@@ -411,7 +411,7 @@ def track_list():
             rating = f"{book['avg_rating']:.1f}" if book['avg_rating'] else '-'
             daily = f"{book['estimated_daily_sales']:.1f}" if book['estimated_daily_sales'] else '-'
             monthly = f"${book['estimated_monthly_revenue']:,.0f}" if book['estimated_monthly_revenue'] else '-'
-            updated = (book['last_snapshot_date'] or '')[:10] or '-'
+            updated = book['last_snapshot_date'] or '-'
 
             title = book['title'] or 'Unknown'
             author = book['author'] or ''
@@ -813,12 +813,16 @@ def report():
 @click.option('--format', 'output_format',
               type=click.Choice(['table', 'csv', 'json']),
               default='table', help='Output format.')
-def report_keywords(limit, min_score, output_format):
+@click.option('--plain', is_flag=True, default=False,
+              help='Plain aligned text instead of a Rich table (fast for '
+                   'large reports).')
+def report_keywords(limit, min_score, output_format, plain):
     """Show top keywords ranked by score.
 
     Examples:
         kdp-scout report keywords
         kdp-scout report keywords --limit 100 --min-score 50
+        kdp-scout report keywords --limit 5000 --plain
         kdp-scout report keywords --format csv > keywords.csv
     """
     from kdp_scout.reporting import ReportingEngine
@@ -827,6 +831,7 @@ def report_keywords(limit, min_score, output_format):
     try:
         engine.keyword_summary(
             limit=limit, min_score=min_score, output_format=output_format,
+            plain=plain,
         )
     finally:
         engine.close()
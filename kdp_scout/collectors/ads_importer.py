@@ -8,10 +8,10 @@ the keywords table to enrich keyword metrics with real ads performance data.
 """
 
 import logging
-import re
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from kdp_scout.db import AdsRepository, KeywordRepository, init_db
@@ -50,6 +50,25 @@ COLUMN_ALIASES = {
     ],
 }
 
+# Characters dropped from numeric cells before parsing, in one
+# str.translate pass
+_INT_STRIP = str.maketrans('', '', ', ')
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+
+# Reverse lookup: alias -> canonical name, plus each alias's position in
+# its list so that when a report has several matching columns the
+# earliest-listed alias still wins
+ALIAS_TO_CANONICAL = {
+    alias: canonical
+    for canonical, aliases in COLUMN_ALIASES.items()
+    for alias in aliases
+}
+_ALIAS_RANK = {
+    alias: rank
+    for aliases in COLUMN_ALIASES.values()
+    for rank, alias in enumerate(aliases)
+}
+
 
 class AdsImporter:
     """Imports Amazon Ads search term report CSVs into the database."""
@@ -117,8 +136,27 @@ class AdsImporter:
         now = datetime.now().isoformat()
         today = datetime.now().strftime('%Y-%m-%d')
 
-        for _, row in df.iterrows():
-            search_term = self._get_value(row, column_map, 'search_term')
+        # Parse whole columns at once rather than cell by cell
+        columns = {
+            name: self._column_values(df, column_map, name, parser)
+            for name, parser in (
+                ('search_term', None),
+                ('campaign_name', None),
+                ('ad_group', None),
+                ('match_type', None),
+                ('impressions', self._parse_int_series),
+                ('clicks', self._parse_int_series),
+                ('ctr', self._parse_percentage_series),
+                ('spend', self._parse_currency_series),
+                ('sales', self._parse_currency_series),
+                ('acos', self._parse_percentage_series),
+                ('orders', self._parse_int_series),
+            )
+        }
+
+        for (search_term, campaign_name, ad_group, match_type, impressions,
+             clicks, ctr, spend, sales, acos, orders) in zip(
+                *columns.values()):
             if not search_term or not isinstance(search_term, str):
                 skipped += 1
                 continue
@@ -128,32 +166,6 @@ class AdsImporter:
                 skipped += 1
                 continue
 
-            # Parse numeric values
-            impressions = self._parse_int(
-                self._get_value(row, column_map, 'impressions')
-            )
-            clicks = self._parse_int(
-                self._get_value(row, column_map, 'clicks')
-            )
-            ctr = self._parse_percentage(
-                self._get_value(row, column_map, 'ctr')
-            )
-            spend = self._parse_currency(
-                self._get_value(row, column_map, 'spend')
-            )
-            sales = self._parse_currency(
-                self._get_value(row, column_map, 'sales')
-            )
-            acos = self._parse_percentage(
-                self._get_value(row, column_map, 'acos')
-            )
-            orders = self._parse_int(
-                self._get_value(row, column_map, 'orders')
-            )
-            campaign_name = self._get_value(row, column_map, 'campaign_name')
-            ad_group = self._get_value(row, column_map, 'ad_group')
-            match_type = self._get_value(row, column_map, 'match_type')
-
             # Store in ads_search_terms table
             try:
                 self._ads_repo.add_search_term(
@@ -255,14 +267,12 @@ class AdsImporter:
             columns_lower: List of lowercase column names.
 
         Returns:
-            True if at least 3 known column names are found.
+            True if columns for at least 3 distinct known fields are found.
         """
-        known_terms = set()
-        for canonical, aliases in COLUMN_ALIASES.items():
-            for alias in aliases:
-                if alias in columns_lower:
-                    known_terms.add(canonical)
-                    break
+        known_terms = {
+            ALIAS_TO_CANONICAL[col] for col in columns_lower
+            if col in ALIAS_TO_CANONICAL
+        }
         return len(known_terms) >= 3
 
     def _map_columns(self, columns):
@@ -274,15 +284,24 @@ class AdsImporter:
         Returns:
             Dict mapping canonical names to original column names.
         """
-        column_map = {}
         cols_lower = {str(c).lower().strip(): c for c in columns}
 
+        # Exact matches: one dict lookup per column
+        best = {}
+        for col_lower, col_original in cols_lower.items():
+            canonical = ALIAS_TO_CANONICAL.get(col_lower)
+            if canonical is None:
+                continue
+            rank = _ALIAS_RANK[col_lower]
+            if canonical not in best or rank < best[canonical][0]:
+                best[canonical] = (rank, col_original)
+        column_map = {
+            canonical: col_original
+            for canonical, (_, col_original) in best.items()
+        }
+
         for canonical, aliases in COLUMN_ALIASES.items():
-            for alias in aliases:
-                if alias in cols_lower:
-                    column_map[canonical] = cols_lower[alias]
-                    break
-            else:
+            if canonical not in column_map:
                 # Fuzzy match: look for columns containing the alias
                 for alias in aliases:
                     for col_lower, col_original in cols_lower.items():
@@ -295,24 +314,76 @@ class AdsImporter:
         logger.debug(f'Column mapping: {column_map}')
         return column_map
 
-    def _get_value(self, row, column_map, canonical_name):
-        """Get a value from a row using the column mapping.
+    def _column_values(self, df, column_map, canonical_name, parser=None):
+        """Get one column as a list of Python values, None where missing.
 
         Args:
-            row: pandas Series (a row from the DataFrame).
+            df: The report DataFrame.
             column_map: Dict mapping canonical names to column names.
             canonical_name: The canonical column name to look up.
+            parser: Optional Series parser applied to the whole column.
 
         Returns:
-            The value, or None if the column doesn't exist.
+            List with one value per row; all None if the column doesn't
+            exist.
         """
         col = column_map.get(canonical_name)
         if col is None:
-            return None
-        val = row.get(col)
-        if pd.isna(val):
-            return None
-        return val
+            return [None] * len(df)
+        series = df[col]
+        if parser is not None:
+            series = parser(series)
+        values = series.astype(object)
+        return values.where(series.notna(), None).tolist()
+
+    def _parse_int_series(self, series):
+        """Vectorized _parse_int over a column of strings.
+
+        Args:
+            series: pandas Series of raw cell values.
+
+        Returns:
+            Series of Python ints (no int64 overflow, same as int());
+            unparseable cells are NaN.
+        """
+        cleaned = series.astype(str).str.translate(_INT_STRIP).str.strip()
+        values = pd.to_numeric(cleaned, errors='coerce').astype(float)
+        values = values[np.isfinite(values)]
+        # object dtype, or pandas would turn the ints straight back to floats
+        result = pd.Series(np.nan, index=series.index, dtype=object)
+        result[values.index] = [int(v) for v in values]
+        return result
+
+    def _parse_percentage_series(self, series):
+        """Vectorized _parse_percentage over a column of strings.
+
+        Args:
+            series: pandas Series of raw cell values.
+
+        Returns:
+            float Series of decimals; unparseable cells are NaN.
+        """
+        text = series.astype(str).str.strip()
+        has_percent = text.str.contains('%', regex=False)
+        values = pd.to_numeric(
+            text.str.replace('%', '', regex=False).str.strip(),
+            errors='coerce',
+        )
+        # Values with a % sign, or bare values above 1, are percentages
+        return values.where(~has_percent & (values <= 1), values / 100.0)
+
+    def _parse_currency_series(self, series):
+        """Vectorized _parse_currency over a column of strings.
+
+        Args:
+            series: pandas Series of raw cell values.
+
+        Returns:
+            float Series; unparseable cells are NaN.
+        """
+        cleaned = (series.astype(str)
+                   .str.translate(_CURRENCY_STRIP).str.strip())
+        return pd.to_numeric(cleaned, errors='coerce').astype(float)
 
     def _parse_int(self, value):
         """Parse an integer value, handling commas and whitespace.
@@ -326,7 +397,7 @@ class AdsImporter:
         if value is None:
             return None
         try:
-            cleaned = str(value).replace(',', '').replace(' ', '').strip()
+            cleaned = str(value).translate(_INT_STRIP).strip()
             if not cleaned or cleaned == '-':
                 return None
             return int(float(cleaned))
@@ -371,7 +442,7 @@ class AdsImporter:
         if value is None:
             return None
         try:
-            cleaned = str(value).replace('$', '').replace(',', '').strip()
+            cleaned = str(value).translate(_CURRENCY_STRIP).strip()
             if not cleaned or cleaned == '-':
                 return None
             return float(cleaned)
@@ -13,6 +13,8 @@ Models are calibrated against known data points for each marketplace:
 """
 
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,11 @@ MODELS = {
 KDP_ROYALTY_HIGH = 0.70  # 70% for $2.99-$9.99
 KDP_ROYALTY_LOW = 0.35   # 35% otherwise
 
+# Sales velocity tiers: a value at or above VELOCITY_THRESHOLDS[i] gets
+# VELOCITY_LABELS[i + 1]
+VELOCITY_THRESHOLDS = (0.5, 3, 10, 50)
+VELOCITY_LABELS = ('Minimal', 'Low', 'Moderate', 'Strong', 'Excellent')
+
 
 def estimate_daily_sales(bsr, marketplace='us_kindle'):
     """Estimate daily sales from a BSR number.
@@ -46,6 +53,17 @@ def estimate_daily_sales(bsr, marketplace='us_kindle'):
     if bsr is None or bsr < 1:
         return 0.0
 
+    return _estimate_daily_sales_cached(bsr, marketplace)
+
+
+@lru_cache(maxsize=8192)
+def _estimate_daily_sales_cached(bsr, marketplace):
+    """Memoized body of estimate_daily_sales for validated input.
+
+    Scans and niche analyses see the same BSRs repeatedly, so the pow()
+    is only paid once per (bsr, marketplace) pair. The BSR is used as
+    given (averaged BSRs are floats), not truncated to an int.
+    """
     model = MODELS.get(marketplace)
     if model is None:
         logger.warning(f'Unknown marketplace "{marketplace}", using us_kindle')
@@ -60,6 +78,32 @@ def estimate_daily_sales(bsr, marketplace='us_kindle'):
     return round(daily, 2)
 
 
+def estimate_daily_sales_array(bsrs, marketplace='us_kindle'):
+    """Vectorized estimate_daily_sales over many BSRs.
+
+    Args:
+        bsrs: Sequence or array of BSR numbers. None/NaN and values below 1
+            are treated as invalid.
+        marketplace: Marketplace model to use.
+
+    Returns:
+        float64 numpy array of estimated daily sales, rounded to 2 decimal
+        places, with 0.0 for invalid entries.
+    """
+    import numpy as np
+
+    model = MODELS.get(marketplace)
+    if model is None:
+        logger.warning(f'Unknown marketplace "{marketplace}", using us_kindle')
+        model = MODELS['us_kindle']
+
+    arr = np.asarray(bsrs, dtype=np.float64)
+    valid = arr >= 1
+    daily = np.zeros_like(arr)
+    daily[valid] = model['k'] * np.power(arr[valid], -model['a'])
+    return np.round(daily, 2)
+
+
 def estimate_monthly_revenue(bsr, price, marketplace='us_kindle'):
     """Estimate monthly revenue from BSR and price.
 
@@ -105,13 +149,25 @@ def sales_velocity_label(daily_sales):
     Returns:
         String label like 'Strong', 'Moderate', 'Low', etc.
     """
-    if daily_sales >= 50:
-        return 'Excellent'
-    elif daily_sales >= 10:
-        return 'Strong'
-    elif daily_sales >= 3:
-        return 'Moderate'
-    elif daily_sales >= 0.5:
-        return 'Low'
-    else:
-        return 'Minimal'
+    # NaN fails every threshold check, so it falls to the lowest label;
+    # bisect alone would walk it past every bound
+    if not daily_sales >= VELOCITY_THRESHOLDS[0]:
+        return VELOCITY_LABELS[0]
+    return VELOCITY_LABELS[bisect_right(VELOCITY_THRESHOLDS, daily_sales)]
+
+
+def sales_velocity_labels(daily_sales):
+    """Vectorized sales_velocity_label over many daily sales values.
+
+    Args:
+        daily_sales: Sequence or array of estimated daily sales.
+
+    Returns:
+        numpy array of labels, parallel to daily_sales.
+    """
+    import numpy as np
+
+    # NaN counts as no sales, matching sales_velocity_label
+    values = np.nan_to_num(np.asarray(daily_sales, dtype=np.float64), nan=0.0)
+    idx = np.searchsorted(VELOCITY_THRESHOLDS, values, side='right')
+    return np.array(VELOCITY_LABELS)[idx]
@@ -14,6 +14,10 @@ from kdp_scout.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Max IDs bound into a single IN (...) clause; SQLite builds before 3.32
+# cap a statement at 999 parameters.
+_MAX_IN_PARAMS = 500
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS keywords (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -166,6 +170,9 @@ def init_db():
         # Migration: add score column to keywords if not present
         _migrate_add_score_column(conn)
 
+        # Migration: index score so score-ordered LIMIT queries walk the index
+        _migrate_add_score_index(conn)
+
         # Migration: add semantic_clusters table
         _migrate_add_semantic_clusters_table(conn)
 
@@ -184,6 +191,17 @@ def _migrate_add_score_column(conn):
         logger.info('Migration: added score column to keywords table')
 
 
+def _migrate_add_score_index(conn):
+    """Index (is_active, score) for the score-ordered keyword queries.
+
+    Lives in a migration because score is added by one, not SCHEMA_SQL.
+    """
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_keywords_active_score '
+        'ON keywords(is_active, score)'
+    )
+
+
 def _migrate_add_semantic_clusters_table(conn):
     """Create semantic_clusters table if it doesn't exist."""
     conn.execute("""
@@ -364,6 +382,27 @@ class KeywordRepository:
         Returns:
             List of sqlite3.Row objects with keyword and metric fields.
         """
+        return self.iter_keywords_with_latest_metrics(
+            limit=limit, min_score=min_score, order_by=order_by,
+        ).fetchall()
+
+    def iter_keywords_with_latest_metrics(self, limit=20, min_score=0,
+                                          order_by='score'):
+        """Stream keywords with their most recent metrics.
+
+        Like get_keywords_with_latest_metrics(), but returns the open
+        cursor so callers can consume rows incrementally (e.g. with
+        fetchmany) instead of materializing the whole result.
+
+        Args:
+            limit: Maximum number of results.
+            min_score: Minimum keyword score to include.
+            order_by: Sort order - 'score', 'autocomplete', or 'impressions'.
+
+        Returns:
+            sqlite3.Cursor yielding sqlite3.Row objects with keyword and
+            metric fields.
+        """
         if order_by == 'score':
             order_clause = """
                 ORDER BY k.score DESC,
@@ -399,7 +438,7 @@ class KeywordRepository:
             {order_clause}
             LIMIT ?
         """
-        return self._conn.execute(query, (min_score, limit)).fetchall()
+        return self._conn.execute(query, (min_score, limit))
 
     def get_keyword_with_metrics(self, keyword_id):
         """Get a single keyword with its latest metrics.
@@ -571,6 +610,109 @@ class KeywordRepository:
             query, (keyword_id, f'-{days} days')
         ).fetchall()
 
+    def get_keyword_metrics_histories(self, keyword_ids, days=30):
+        """Get metric snapshots for many keywords in as few queries as possible.
+
+        Bulk form of get_keyword_metrics_history(). IDs are queried in
+        chunks to stay under SQLite's bound-parameter limit.
+
+        Args:
+            keyword_ids: Iterable of keyword IDs.
+            days: Number of days to look back.
+
+        Returns:
+            Dict mapping keyword_id to a list of sqlite3.Row objects ordered
+            by date ascending. Keywords with no snapshots are absent.
+        """
+        keyword_ids = list(keyword_ids)
+        histories = {}
+        for start in range(0, len(keyword_ids), _MAX_IN_PARAMS):
+            chunk = keyword_ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            query = f"""
+                SELECT * FROM keyword_metrics
+                WHERE keyword_id IN ({placeholders})
+                  AND snapshot_date >= date('now', ?)
+                ORDER BY keyword_id, snapshot_date ASC
+            """
+            rows = self._conn.execute(query, (*chunk, f'-{days} days'))
+            for row in rows:
+                histories.setdefault(row['keyword_id'], []).append(row)
+        return histories
+
+    def get_scoring_rows(self, keyword_ids):
+        """Get everything keyword scoring needs for many keywords at once.
+
+        Bulk form of get_keyword_with_metrics(), with the cross-references
+        scoring makes per keyword joined in: the get_ads_data_for_keyword()
+        sums as ads_impressions, ads_clicks and ads_orders (NULL when there
+        is no ads data), get_ads_acos_for_keyword() as acos and
+        get_own_ranking_for_keyword() as own_rank. IDs are queried in
+        chunks to stay under SQLite's bound-parameter limit.
+
+        Args:
+            keyword_ids: Iterable of keyword IDs.
+
+        Returns:
+            Dict mapping keyword_id to a sqlite3.Row. Unknown IDs are absent.
+        """
+        keyword_ids = list(keyword_ids)
+        rows_by_id = {}
+        for start in range(0, len(keyword_ids), _MAX_IN_PARAMS):
+            chunk = keyword_ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            query = f"""
+                WITH chunk AS (
+                    SELECT id, LOWER(keyword) AS term
+                    FROM keywords
+                    WHERE id IN ({placeholders})
+                ),
+                ads AS (
+                    SELECT LOWER(search_term) AS term,
+                           SUM(impressions) AS impressions,
+                           SUM(clicks) AS clicks,
+                           SUM(orders) AS orders,
+                           CASE WHEN SUM(sales) > 0
+                               THEN SUM(spend) / SUM(sales)
+                               ELSE NULL END AS acos
+                    FROM ads_search_terms
+                    WHERE LOWER(search_term) IN (SELECT term FROM chunk)
+                    GROUP BY LOWER(search_term)
+                ),
+                own AS (
+                    SELECT kr.keyword_id, MIN(kr.rank_position) AS best_rank
+                    FROM keyword_rankings kr
+                    JOIN books b ON kr.book_id = b.id
+                    WHERE kr.keyword_id IN (SELECT id FROM chunk)
+                      AND b.is_own = 1
+                    GROUP BY kr.keyword_id
+                )
+                SELECT k.id, k.keyword, k.source, k.first_seen, k.category,
+                       k.score,
+                       km.autocomplete_position, km.snapshot_date,
+                       km.estimated_volume, km.competition_count,
+                       km.avg_bsr_top_results, km.suggested_bid,
+                       km.impressions, km.clicks, km.orders,
+                       ads.impressions AS ads_impressions,
+                       ads.clicks AS ads_clicks,
+                       ads.orders AS ads_orders,
+                       ads.acos AS acos,
+                       own.best_rank AS own_rank
+                FROM chunk c
+                JOIN keywords k ON k.id = c.id
+                LEFT JOIN keyword_metrics km ON k.id = km.keyword_id
+                    AND km.snapshot_date = (
+                        SELECT MAX(snapshot_date)
+                        FROM keyword_metrics
+                        WHERE keyword_id = k.id
+                    )
+                LEFT JOIN ads ON ads.term = c.term
+                LEFT JOIN own ON own.keyword_id = k.id
+            """
+            for row in self._conn.execute(query, chunk):
+                rows_by_id[row['id']] = row
+        return rows_by_id
+
 
 class BookRepository:
     """Data access for books and book_snapshots tables."""
@@ -790,7 +932,7 @@ class BookRepository:
                    bs.price_kindle, bs.price_paperback,
                    bs.review_count, bs.avg_rating, bs.page_count,
                    bs.estimated_daily_sales, bs.estimated_monthly_revenue,
-                   bs.snapshot_date as last_snapshot_date
+                   substr(bs.snapshot_date, 1, 10) as last_snapshot_date
             FROM books b
             LEFT JOIN book_snapshots bs ON b.id = bs.book_id
                 AND bs.snapshot_date = (
@@ -802,6 +944,36 @@ class BookRepository:
         """
         return self._conn.execute(query).fetchall()
 
+    def get_book_report_rows(self):
+        """Get the competitor report columns for all books as plain tuples.
+
+        Same rows and order as get_books_with_latest_snapshot(), but only
+        the columns the report shows, returned as tuples so callers can
+        unpack them positionally instead of doing a keyed lookup per cell.
+
+        Returns:
+            List of (asin, title, author, bsr_overall, price_kindle,
+            review_count, avg_rating, estimated_daily_sales,
+            estimated_monthly_revenue, is_own) tuples.
+        """
+        query = """
+            SELECT b.asin, b.title, b.author,
+                   bs.bsr_overall, bs.price_kindle, bs.review_count,
+                   bs.avg_rating, bs.estimated_daily_sales,
+                   bs.estimated_monthly_revenue, b.is_own
+            FROM books b
+            LEFT JOIN book_snapshots bs ON b.id = bs.book_id
+                AND bs.snapshot_date = (
+                    SELECT MAX(snapshot_date)
+                    FROM book_snapshots
+                    WHERE book_id = b.id
+                )
+            ORDER BY b.is_own DESC, bs.bsr_overall ASC
+        """
+        cursor = self._conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(query).fetchall()
+
 
 class AdsRepository:
     """Data access for ads_search_terms table."""
@@ -875,13 +1047,16 @@ class AdsRepository:
             'ORDER BY orders DESC, impressions DESC'
         ).fetchall()
 
-    def get_aggregated_search_terms(self):
+    def get_aggregated_search_terms(self, limit=None):
         """Get search terms aggregated across all report dates.
 
+        Args:
+            limit: Optional maximum number of rows, applied in SQL.
+
         Returns:
             List of sqlite3.Row objects with summed metrics per search term.
         """
-        return self._conn.execute(
+        query = (
             'SELECT search_term, '
             '  SUM(impressions) as total_impressions, '
             '  SUM(clicks) as total_clicks, '
@@ -897,7 +1072,10 @@ class AdsRepository:
             'FROM ads_search_terms '
             'GROUP BY search_term '
             'ORDER BY total_orders DESC, total_impressions DESC'
-        ).fetchall()
+        )
+        if limit is not None:
+            return self._conn.execute(query + ' LIMIT ?', (limit,)).fetchall()
+        return self._conn.execute(query).fetchall()
 
     def get_search_term_count(self):
         """Get the total number of search term records."""
@@ -40,6 +40,13 @@ DEFAULT_WEIGHTS = {
     'semantic_relevance': 0.10,
 }
 
+# Raw signal columns taken by KeywordScorer.score_keywords
+SCORE_SIGNALS = (
+    'autocomplete_position', 'competition_count', 'avg_bsr_top_results',
+    'impressions', 'clicks', 'orders', 'estimated_volume', 'suggested_bid',
+    'acos', 'own_rank',
+)
+
 
 def normalize_autocomplete(position):
     """Normalize autocomplete position to 0-1.
@@ -225,6 +232,34 @@ def normalize_semantic_relevance(score):
     return min(1.0, float(score))
 
 
+def _score_kernel(weights, autocomplete_position, competition_count,
+                  avg_bsr_top_results, impressions, clicks, orders,
+                  estimated_volume, suggested_bid, acos, own_rank):
+    """Unrounded composite score (0-100) from raw signals.
+
+    Adds the same weighted terms in the same order as
+    KeywordScorer.score_keyword_detailed, so the totals agree, but
+    without building the per-component breakdown.
+    """
+    return (
+        normalize_autocomplete(autocomplete_position)
+        * weights['autocomplete'] * 100
+        + normalize_competition(competition_count)
+        * weights['competition'] * 100
+        + normalize_bsr(avg_bsr_top_results) * weights['bsr_demand'] * 100
+        + normalize_impressions(impressions) * weights['ads_impressions'] * 100
+        + normalize_orders(orders) * weights['ads_orders'] * 100
+        + normalize_acos(acos) * weights['ads_profitability'] * 100
+        + normalize_search_volume(estimated_volume)
+        * weights['search_volume'] * 100
+        + normalize_suggested_bid(suggested_bid)
+        * weights['commercial_value'] * 100
+        + normalize_ctr(clicks, impressions)
+        * weights['click_through_rate'] * 100
+        + normalize_own_ranking(own_rank) * weights['own_ranking'] * 100
+    )
+
+
 def generate_semantic_phrases(keywords, book_context=None):
     """Generate semantic search phrases from keywords using Claude API.
 
@@ -439,6 +474,9 @@ class KeywordScorer:
     and the final score is scaled to 0-100.
     """
 
+    # Every attribute is set in __init__; no per-instance __dict__
+    __slots__ = ('_repo', '_weights')
+
     def __init__(self, weights=None):
         """Initialize with database access.
 
@@ -464,7 +502,10 @@ class KeywordScorer:
         Returns:
             Composite score (0-100).
         """
-        return self.score_keyword_detailed(keyword_id)['total']
+        signals = self._gather_signals(keyword_id)
+        if signals is None:
+            return 0.0
+        return round(_score_kernel(self._weights, **signals), 1)
 
     def score_keyword_detailed(self, keyword_id: int) -> dict:
         """Compute detailed score breakdown for a keyword.
@@ -480,33 +521,20 @@ class KeywordScorer:
             Dict with 'total' (float 0-100) and 'components' (dict of
             component breakdowns).
         """
-        kw = self._repo.get_keyword_with_metrics(keyword_id)
-        if kw is None:
+        signals = self._gather_signals(keyword_id)
+        if signals is None:
             return self._empty_result()
 
-        # Gather raw values from metrics
-        autocomplete_pos = kw['autocomplete_position']
-        competition_count = kw['competition_count']
-        avg_bsr = kw['avg_bsr_top_results']
-        impressions = kw['impressions']
-        clicks = kw['clicks']
-        orders = kw['orders']
-        estimated_volume = kw['estimated_volume']
-        suggested_bid = kw['suggested_bid']
-
-        # Fall back to ads_search_terms if keyword_metrics lacks ads data
-        if not impressions and not clicks and not orders:
-            ads_data = self._repo.get_ads_data_for_keyword(kw['keyword'])
-            if ads_data:
-                impressions = ads_data['impressions']
-                clicks = ads_data['clicks']
-                orders = ads_data['orders']
-
-        # Cross-reference: ACOS from ads_search_terms
-        acos = self._repo.get_ads_acos_for_keyword(kw['keyword'])
-
-        # Cross-reference: own book ranking
-        own_rank = self._repo.get_own_ranking_for_keyword(keyword_id)
+        autocomplete_pos = signals['autocomplete_position']
+        competition_count = signals['competition_count']
+        avg_bsr = signals['avg_bsr_top_results']
+        impressions = signals['impressions']
+        clicks = signals['clicks']
+        orders = signals['orders']
+        estimated_volume = signals['estimated_volume']
+        suggested_bid = signals['suggested_bid']
+        acos = signals['acos']
+        own_rank = signals['own_rank']
 
         # Normalize each signal
         components = {}
@@ -643,6 +671,57 @@ class KeywordScorer:
             'components': components,
         }
 
+    def _gather_signals(self, keyword_id):
+        """Collect the raw scoring signals for a keyword.
+
+        Args:
+            keyword_id: Database ID of the keyword.
+
+        Returns:
+            Dict keyed by SCORE_SIGNALS, or None if the keyword doesn't
+            exist.
+        """
+        kw = self._repo.get_keyword_with_metrics(keyword_id)
+        if kw is None:
+            return None
+
+        # Gather raw values from metrics
+        autocomplete_pos = kw['autocomplete_position']
+        competition_count = kw['competition_count']
+        avg_bsr = kw['avg_bsr_top_results']
+        impressions = kw['impressions']
+        clicks = kw['clicks']
+        orders = kw['orders']
+        estimated_volume = kw['estimated_volume']
+        suggested_bid = kw['suggested_bid']
+
+        # Fall back to ads_search_terms if keyword_metrics lacks ads data
+        if not impressions and not clicks and not orders:
+            ads_data = self._repo.get_ads_data_for_keyword(kw['keyword'])
+            if ads_data:
+                impressions = ads_data['impressions']
+                clicks = ads_data['clicks']
+                orders = ads_data['orders']
+
+        # Cross-reference: ACOS from ads_search_terms
+        acos = self._repo.get_ads_acos_for_keyword(kw['keyword'])
+
+        # Cross-reference: own book ranking
+        own_rank = self._repo.get_own_ranking_for_keyword(keyword_id)
+
+        return {
+            'autocomplete_position': autocomplete_pos,
+            'competition_count': competition_count,
+            'avg_bsr_top_results': avg_bsr,
+            'impressions': impressions,
+            'clicks': clicks,
+            'orders': orders,
+            'estimated_volume': estimated_volume,
+            'suggested_bid': suggested_bid,
+            'acos': acos,
+            'own_rank': own_rank,
+        }
+
     def _empty_result(self):
         """Return an empty score result for missing keywords."""
         components = {}
@@ -656,6 +735,129 @@ class KeywordScorer:
             }
         return {'total': 0.0, 'components': components}
 
+    def score_keywords(self, signals):
+        """Score many keywords at once from columns of raw signals.
+
+        The vectorized counterpart of score_keyword: each normalizer is
+        applied to a whole column with NumPy instead of once per keyword,
+        and components are added in the same order. Signals are used as
+        given, so the ads_search_terms fallback must already be applied.
+
+        Args:
+            signals: Dict mapping signal names to equal-length sequences
+                of raw values, None for missing data. Names are those of
+                SCORE_SIGNALS; absent names count as no data.
+
+        Returns:
+            float64 numpy array of composite scores (0-100), rounded to
+            one decimal place, parallel to the input columns.
+        """
+        import numpy as np
+
+        n = len(next(iter(signals.values()))) if signals else 0
+        cols = {
+            name: (np.asarray(signals[name], dtype=np.float64)
+                   if name in signals else np.full(n, np.nan))
+            for name in SCORE_SIGNALS
+        }
+        ac = cols['autocomplete_position']
+        comp = cols['competition_count']
+        bsr = cols['avg_bsr_top_results']
+        imp = cols['impressions']
+        clicks = cols['clicks']
+        orders = cols['orders']
+        volume = cols['estimated_volume']
+        bid = cols['suggested_bid']
+        acos = cols['acos']
+        rank = cols['own_rank']
+
+        # NaN (missing) fails every comparison below, so it scores 0 like
+        # None does in the scalar normalizers; log10 of the masked-out
+        # values may warn, hence errstate
+        with np.errstate(all='ignore'):
+            norms = (
+                ('autocomplete',
+                 np.where(ac > 0, np.maximum(0.0, (11 - ac) / 10), 0.0)),
+                ('competition',
+                 np.where(comp >= 0, 1.0 / (1.0 + comp / 50000.0), 0.0)),
+                ('bsr_demand',
+                 np.where(bsr > 0,
+                          np.maximum(0.0, 1.0 - np.log10(bsr) / 6.0), 0.0)),
+                ('ads_impressions',
+                 np.where(imp > 0, np.minimum(
+                     1.0, np.log10(np.maximum(1, imp)) / 5.0), 0.0)),
+                ('ads_orders',
+                 np.where(orders > 0, np.minimum(
+                     1.0, np.log10(np.maximum(1, orders)) / 3.0), 0.0)),
+                ('ads_profitability',
+                 np.where(np.isnan(acos), 0.0,
+                          np.maximum(0.0, 1.0 - acos * 100.0 / 100.0))),
+                ('search_volume',
+                 np.where(volume > 0, np.minimum(
+                     1.0, np.log10(np.maximum(1, volume)) / 5.0), 0.0)),
+                ('commercial_value',
+                 np.where(bid > 0, np.minimum(1.0, bid / 3.0), 0.0)),
+                ('click_through_rate',
+                 np.where((clicks >= 0) & (imp > 0), np.minimum(
+                     1.0, clicks / imp / 0.05), 0.0)),
+                ('own_ranking',
+                 np.where(rank > 0,
+                          np.maximum(0.0, (50.0 - rank) / 49.0), 0.0)),
+            )
+
+        total = np.zeros(n)
+        for name, norm in norms:
+            total += norm * self._weights[name] * 100
+        return np.round(total, 1)
+
+    def score_keyword_batch(self, keyword_ids) -> list:
+        """Score many keywords from one bulk read of their signals.
+
+        Gives the same scores as score_keyword for each ID, but all
+        signals come from a single get_scoring_rows() call instead of
+        several queries per keyword.
+
+        Args:
+            keyword_ids: Sequence of keyword IDs.
+
+        Returns:
+            List of composite scores (0-100), parallel to keyword_ids.
+            Unknown IDs score 0.0.
+        """
+        rows = self._repo.get_scoring_rows(keyword_ids)
+        scores = []
+        for keyword_id in keyword_ids:
+            row = rows.get(keyword_id)
+            if row is None:
+                scores.append(0.0)
+                continue
+
+            impressions = row['impressions']
+            clicks = row['clicks']
+            orders = row['orders']
+            # Same ads_search_terms fallback as _gather_signals
+            if (not impressions and not clicks and not orders
+                    and row['ads_impressions'] is not None):
+                impressions = row['ads_impressions']
+                clicks = row['ads_clicks']
+                orders = row['ads_orders']
+
+            total = _score_kernel(
+                self._weights,
+                autocomplete_position=row['autocomplete_position'],
+                competition_count=row['competition_count'],
+                avg_bsr_top_results=row['avg_bsr_top_results'],
+                impressions=impressions,
+                clicks=clicks,
+                orders=orders,
+                estimated_volume=row['estimated_volume'],
+                suggested_bid=row['suggested_bid'],
+                acos=row['acos'],
+                own_rank=row['own_rank'],
+            )
+            scores.append(round(total, 1))
+        return scores
+
     def score_all_keywords(self, recalculate=False) -> int:
         """Score active keywords in the database.
 
@@ -673,8 +875,8 @@ class KeywordScorer:
 
         count = 0
 
-        for keyword_id in keyword_ids:
-            score = self.score_keyword(keyword_id)
+        scores = self.score_keyword_batch(keyword_ids)
+        for keyword_id, score in zip(keyword_ids, scores):
             self._repo.update_score(keyword_id, score)
             count += 1
 
@@ -14,6 +14,7 @@ where the #20 book has a beatable BSR for your projected launch velocity.
 import logging
 import re
 import time
+from bisect import bisect_right
 
 from bs4 import BeautifulSoup
 
@@ -32,6 +33,17 @@ SPONSORED_MARKERS = [
     's-sponsored-label', 'a-spacing-micro s-sponsored-label',
 ]
 
+# Opportunity score tiers as ascending lower bounds: a value scores
+# _X_SCORES[bisect_right(_X_BOUNDS, value)], i.e. the tier of the highest
+# bound it reaches. Values below the first bound take the first score.
+_BSR_BOUNDS = (10_000, 20_000, 50_000, 100_000, 200_000)
+_BSR_SCORES = (0.1, 0.2, 0.4, 0.6, 0.8, 1.0)
+_REVIEW_BOUNDS = (20, 50, 100, 250, 500)
+_REVIEW_SCORES = (1.0, 0.8, 0.6, 0.4, 0.2, 0.1)
+# Applies to positive revenue only; no revenue scores 0
+_DEMAND_BOUNDS = (10, 50, 200, 500)
+_DEMAND_SCORES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
 
 def score_niche(keyword, department='kindle', top_n=10):
     """Score a keyword niche by analyzing top Amazon search results.
@@ -255,54 +267,29 @@ def _compute_opportunity_score(metrics, result_count):
     # BSR > 200k avg = very low competition, < 10k = very high competition
     avg_bsr = metrics.get('avg_bsr')
     if avg_bsr:
-        if avg_bsr >= 200_000:
-            bsr_score = 1.0
-        elif avg_bsr >= 100_000:
-            bsr_score = 0.8
-        elif avg_bsr >= 50_000:
-            bsr_score = 0.6
-        elif avg_bsr >= 20_000:
-            bsr_score = 0.4
-        elif avg_bsr >= 10_000:
-            bsr_score = 0.2
+        # NaN fails every bound, so like the old if-chain it takes the
+        # bottom tier; bisect alone would walk it past every bound
+        if avg_bsr >= _BSR_BOUNDS[0]:
+            bsr_score = _BSR_SCORES[bisect_right(_BSR_BOUNDS, avg_bsr)]
         else:
-            bsr_score = 0.1
+            bsr_score = _BSR_SCORES[0]
         score += bsr_score * 40
 
     # Review barrier (30% weight)
     # < 20 avg reviews = easy entry, > 500 = very hard
     avg_reviews = metrics.get('avg_reviews')
     if avg_reviews is not None:
-        if avg_reviews < 20:
-            review_score = 1.0
-        elif avg_reviews < 50:
-            review_score = 0.8
-        elif avg_reviews < 100:
-            review_score = 0.6
-        elif avg_reviews < 250:
-            review_score = 0.4
-        elif avg_reviews < 500:
-            review_score = 0.2
-        else:
-            review_score = 0.1
+        review_score = _REVIEW_SCORES[bisect_right(_REVIEW_BOUNDS, avg_reviews)]
         score += review_score * 30
 
     # Demand validation (20% weight)
     # Some revenue is needed to confirm demand exists
     avg_monthly = metrics.get('avg_monthly_revenue')
     if avg_monthly is not None:
-        if avg_monthly >= 500:
-            demand_score = 1.0
-        elif avg_monthly >= 200:
-            demand_score = 0.8
-        elif avg_monthly >= 50:
-            demand_score = 0.6
-        elif avg_monthly >= 10:
-            demand_score = 0.4
-        elif avg_monthly > 0:
-            demand_score = 0.2
-        else:
-            demand_score = 0.0
+        # Multiplying by the > 0 check scores no revenue as 0
+        demand_score = (avg_monthly > 0) * _DEMAND_SCORES[
+            bisect_right(_DEMAND_BOUNDS, avg_monthly)
+        ]
         score += demand_score * 20
 
     # Underserved ratio (10% weight)
@@ -7,14 +7,21 @@ campaign import and KDP backend keyword optimization.
 
 import csv
 import io
+import json
 import logging
+import math
 import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import repeat
 
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 
+from kdp_scout.config import Config
 from kdp_scout.db import (
     KeywordRepository, BookRepository, AdsRepository,
     KeywordRankingRepository, SemanticClusterRepository, init_db,
@@ -32,40 +39,234 @@ BID_TIERS = [
     (0, 0.35),
 ]
 
+# BID_TIERS flipped to ascending order, for bisect in _score_to_bid and
+# searchsorted in _scores_to_bids
+_BID_THRESHOLDS = tuple(t for t, _ in reversed(BID_TIERS))
+_BID_VALUES = tuple(b for _, b in reversed(BID_TIERS))
+
 # KDP backend keyword constraints
 KDP_SLOT_COUNT = 7
 KDP_SLOT_MAX_BYTES = 50
 
+# Cell styles parsed once; table cells are built as Text(value, style=...)
+# so Rich never has to run its markup parser over them.
+_STYLES = {
+    name: Style.parse(name)
+    for name in ('dim', 'yellow', 'green', 'bold green', 'red', 'bold red')
+}
+_NO_STYLE = Style.null()
+
+# Score color buckets: _SCORE_STYLES[bisect_right(_SCORE_THRESHOLDS, s)]
+# gives >=75 bold green, >=50 green, >=25 yellow, >=10 dim, else plain
+_SCORE_THRESHOLDS = (10, 25, 50, 75)
+_SCORE_STYLES = (
+    _NO_STYLE,
+    _STYLES['dim'],
+    _STYLES['yellow'],
+    _STYLES['green'],
+    _STYLES['bold green'],
+)
+
+# ACOS color buckets (percent): bisect_left so the bounds are exclusive,
+# giving <=50 green, <=100 yellow, >100 red
+_ACOS_THRESHOLDS = (50, 100)
+_ACOS_STYLES = (_STYLES['green'], _STYLES['yellow'], _STYLES['red'])
+
+# Column specs (header, add_column kwargs) shared by every table built
+# for a report; only the rows change between calls.
+_KEYWORD_COLUMNS = (
+    ('#', dict(style='dim', width=3, justify='right')),
+    ('Keyword', dict(style='bold', ratio=3, no_wrap=False)),
+    ('Score', dict(justify='right', width=5, style='bold cyan')),
+    ('Pos', dict(justify='center', width=3)),
+    ('Impr', dict(justify='right', width=6)),
+    ('Clk', dict(justify='right', width=4)),
+    ('Ord', dict(justify='right', width=4)),
+    ('Source', dict(justify='center', width=10)),
+)
+
+# Single-line, non-wrapping title keeps every competitor row the same
+# height, so Rich can skip its per-row wrap and measure pass.
+_COMPETITOR_COLUMNS = (
+    ('ASIN', dict(width=12, no_wrap=True)),
+    ('Title', dict(ratio=3, no_wrap=True, overflow='ellipsis')),
+    ('BSR', dict(justify='right', width=9)),
+    ('Price', dict(justify='right', width=7)),
+    ('Reviews', dict(justify='right', width=8)),
+    ('Rating', dict(justify='center', width=6)),
+    ('Sales/Day', dict(justify='right', width=10)),
+    ('Rev/Month', dict(justify='right', width=10)),
+)
+
+# Competitor title cell format keyed by (is_own, has_author), and row
+# style keyed by is_own
+_TITLE_FMT = {
+    (False, False): '{0}',
+    (False, True): '{0} — {1}',
+    (True, False): '[bold]{0}[/bold]',
+    (True, True): '[bold]{0} — {1}[/bold]',
+}
+_OWN_ROW_STYLE = {True: 'bold green', False: ''}
+
+_RANKING_GAP_COLUMNS = (
+    ('#', dict(style='dim', width=4, justify='right')),
+    ('Keyword', dict(style='bold', ratio=3)),
+    ('Competitor', dict(ratio=2)),
+    ('Their Pos', dict(justify='center', width=10)),
+    ('Score', dict(justify='right', width=7)),
+    ('Priority', dict(width=12)),
+)
+
+_POSITION_GAP_COLUMNS = (
+    ('#', dict(style='dim', width=4, justify='right')),
+    ('Keyword', dict(style='bold', ratio=3)),
+    ('Your Pos', dict(justify='center', width=9)),
+    ('Their Pos', dict(justify='center', width=10)),
+    ('Competitor', dict(ratio=2)),
+    ('Gap', dict(justify='center', width=6)),
+)
+
+_ADS_OPPORTUNITY_COLUMNS = (
+    ('#', dict(style='dim', width=4, justify='right')),
+    ('Search Term', dict(style='bold', ratio=3)),
+    ('Impressions', dict(justify='right', width=12)),
+    ('Clicks', dict(justify='right', width=8)),
+    ('Spend', dict(justify='right', width=10)),
+    ('Action', dict(width=20)),
+)
+
+_ADS_PERFORMANCE_COLUMNS = (
+    ('#', dict(style='dim', width=3, justify='right')),
+    ('Search Term', dict(style='bold', ratio=3, no_wrap=False)),
+    ('Impr', dict(justify='right', width=6)),
+    ('Clk', dict(justify='right', width=4)),
+    ('CTR', dict(justify='right', width=5)),
+    ('Spend', dict(justify='right', width=7)),
+    ('Sales', dict(justify='right', width=7)),
+    ('ACOS', dict(justify='right', width=5)),
+    ('Ord', dict(justify='right', width=4)),
+)
+
+_TREND_COLUMNS = (
+    ('#', dict(style='dim', width=4, justify='right')),
+    ('Keyword', dict(style='bold', ratio=3)),
+    ('Score', dict(justify='right', width=7)),
+    ('AC Pos Change', dict(justify='center', width=14)),
+    ('Impressions Change', dict(justify='center', width=18)),
+    ('Snapshots', dict(justify='center', width=10)),
+)
+
+_PHRASE_DETAIL_COLUMNS = (
+    ('#', dict(style='dim', width=3, justify='right')),
+    ('Phrase', dict(style='bold', ratio=3)),
+    ('Relevance', dict(justify='center', width=10)),
+    ('Cluster', dict(ratio=2)),
+)
+
+# Rows fetched and written per step when streaming CSV exports
+EXPORT_BATCH_SIZE = 100
+
+# Rows sampled to size columns in plain (non-Rich) table output
+PLAIN_WIDTH_SAMPLE = 100
+
+# Database paths whose schema has already been initialized in this process
+_INITIALIZED = set()
+
+# Repository attributes created on first access by ReportingEngine
+_REPO_ATTRS = ('_kw_repo', '_book_repo', '_ads_repo', '_ranking_repo')
+
+
+def _ensure_db_initialized():
+    """Run init_db() once per database path for the lifetime of the process."""
+    db_path = Config.get_db_path()
+    if db_path not in _INITIALIZED:
+        init_db()
+        _INITIALIZED.add(db_path)
+
 
 class ReportingEngine:
-    """Generates formatted reports for keyword, competitor, and ads data."""
+    """Generates formatted reports for keyword, competitor, and ads data.
+
+    Repositories are opened lazily, so a report only pays for the
+    database connections it actually uses.
+    """
+
+    # The caches live in slots. __dict__ stays for the cached_property
+    # repositories, which store themselves there on first access and are
+    # then plain dict hits; close() relies on that to find opened ones.
+    __slots__ = ('_kw_cache', '_book_partition', '__dict__')
 
     def __init__(self):
         """Initialize the reporting engine with database access."""
-        init_db()
-        self._kw_repo = KeywordRepository()
-        self._book_repo = BookRepository()
-        self._ads_repo = AdsRepository()
-        self._ranking_repo = KeywordRankingRepository()
+        _ensure_db_initialized()
+        self._kw_cache = {}
+        self._book_partition = None
+
+    @cached_property
+    def _kw_repo(self):
+        return KeywordRepository()
+
+    @cached_property
+    def _book_repo(self):
+        return BookRepository()
+
+    @cached_property
+    def _ads_repo(self):
+        return AdsRepository()
+
+    @cached_property
+    def _ranking_repo(self):
+        return KeywordRankingRepository()
+
+    def _cached_keywords(self, limit, min_score, order_by):
+        """Memoized get_keywords_with_latest_metrics for this engine.
+
+        Reports that run back to back on one engine (e.g. the semantic
+        export, which also runs the word-packed export) share one query.
+        """
+        key = (limit, min_score, order_by)
+        keywords = self._kw_cache.get(key)
+        if keywords is None:
+            keywords = self._kw_repo.get_keywords_with_latest_metrics(
+                limit=limit, min_score=min_score, order_by=order_by,
+            )
+            self._kw_cache[key] = keywords
+        return keywords
+
+    def _partition_books(self):
+        """Split tracked book IDs into (own_ids, competitor_ids).
+
+        Cached on the engine; engines are short-lived, one per command,
+        so the books table can't change underneath the cache.
+        """
+        if self._book_partition is None:
+            own_ids, comp_ids = [], []
+            for book in self._book_repo.get_all_books():
+                (own_ids if book['is_own'] else comp_ids).append(book['id'])
+            self._book_partition = (own_ids, comp_ids)
+        return self._book_partition
 
     def close(self):
-        """Close database connections."""
-        self._kw_repo.close()
-        self._book_repo.close()
-        self._ads_repo.close()
-        self._ranking_repo.close()
+        """Close database connections that were actually opened."""
+        for attr in _REPO_ATTRS:
+            repo = self.__dict__.pop(attr, None)
+            if repo is not None:
+                repo.close()
 
     # ── Keyword Reports ───────────────────────────────────────────
 
-    def keyword_summary(self, limit=50, min_score=0, output_format='table'):
+    def keyword_summary(self, limit=50, min_score=0, output_format='table',
+                        plain=False):
         """Print a rich table of top keywords ranked by score.
 
         Args:
             limit: Maximum number of keywords to display.
             min_score: Minimum score threshold.
             output_format: 'table', 'csv', or 'json'.
+            plain: If True, print pre-aligned plain text rows instead of a
+                Rich table. Much faster for very large reports.
         """
-        keywords = self._kw_repo.get_keywords_with_latest_metrics(
+        keywords = self._cached_keywords(
             limit=limit, min_score=min_score, order_by='score',
         )
 
@@ -82,73 +283,83 @@ class ReportingEngine:
         if output_format == 'json':
             self._keyword_summary_json(keywords)
             return
+        if plain:
+            self._keyword_summary_plain(keywords, min_score)
+            return
 
-        table = Table(
-            title='Top Keywords (by Score)',
-            show_lines=False,
-            expand=True,
-        )
-        table.add_column('#', style='dim', width=3, justify='right')
-        table.add_column('Keyword', style='bold', ratio=3, no_wrap=False)
-        table.add_column('Score', justify='right', width=5,
-                         style='bold cyan')
-        table.add_column('Pos', justify='center', width=3)
-        table.add_column('Impr', justify='right', width=6)
-        table.add_column('Clk', justify='right', width=4)
-        table.add_column('Ord', justify='right', width=4)
-        table.add_column('Source', justify='center', width=10)
+        table = _new_keyword_table()
 
-        for i, kw in enumerate(keywords, 1):
-            pos = (str(kw['autocomplete_position'])
-                   if kw['autocomplete_position'] else '-')
-            impressions = (_fmt_number(kw['impressions'])
-                          if kw['impressions'] else '-')
-            clicks = (_fmt_number(kw['clicks'])
-                      if kw['clicks'] else '-')
-            orders = (_fmt_number(kw['orders'])
-                      if kw['orders'] else '-')
-            score = f"{kw['score']:.0f}" if kw['score'] else '0'
+        # Cells are formatted inline and the score is colored by bucket
+        # lookup, so building a row is one expression with no helper calls
+        rows = [
+            (
+                str(i),
+                kw['keyword'],
+                Text(
+                    f"{kw['score']:.0f}" if kw['score'] else '0',
+                    style=_SCORE_STYLES[
+                        bisect_right(_SCORE_THRESHOLDS, kw['score'] or 0)
+                    ],
+                ),
+                str(kw['autocomplete_position'])
+                if kw['autocomplete_position'] else '-',
+                f"{int(kw['impressions']):,}" if kw['impressions'] else '-',
+                f"{int(kw['clicks']):,}" if kw['clicks'] else '-',
+                f"{int(kw['orders']):,}" if kw['orders'] else '-',
+                kw['source'] or '-',
+            )
+            for i, kw in enumerate(keywords, 1)
+        ]
+        _bulk_add_rows(table, rows)
 
-            # Color-code score (0-100 scale)
-            score_val = kw['score'] or 0
-            if score_val >= 75:
-                score_str = f'[bold green]{score}[/bold green]'
-            elif score_val >= 50:
-                score_str = f'[green]{score}[/green]'
-            elif score_val >= 25:
-                score_str = f'[yellow]{score}[/yellow]'
-            elif score_val >= 10:
-                score_str = f'[dim]{score}[/dim]'
-            else:
-                score_str = score
+        total = self._kw_repo.get_keyword_count()
+        _print_buffered(
+            table,
+            f'\n[dim]Showing {len(keywords)} of {total} total keywords '
+            f'(min score: {min_score})[/dim]',
+        )
 
-            table.add_row(
+    def _keyword_summary_plain(self, keywords, min_score):
+        """Output keyword summary as pre-aligned plain text rows.
+
+        Skips Rich's measurement and wrapping passes entirely, so output
+        time stays linear in the number of rows.
+        """
+        headers = ('#', 'Keyword', 'Score', 'Pos', 'Impr', 'Clk', 'Ord',
+                   'Source')
+        right_aligned = (True, False, True, True, True, True, True, False)
+        rows = [
+            (
                 str(i),
                 kw['keyword'],
-                score_str,
-                pos,
-                impressions,
-                clicks,
-                orders,
+                f"{kw['score']:.0f}" if kw['score'] else '0',
+                str(kw['autocomplete_position'])
+                if kw['autocomplete_position'] else '-',
+                f"{int(kw['impressions']):,}" if kw['impressions'] else '-',
+                f"{int(kw['clicks']):,}" if kw['clicks'] else '-',
+                f"{int(kw['orders']):,}" if kw['orders'] else '-',
                 kw['source'] or '-',
             )
+            for i, kw in enumerate(keywords, 1)
+        ]
+        _write_plain_table(headers, rows, right_aligned)
 
-        console.print(table)
         total = self._kw_repo.get_keyword_count()
-        console.print(
-            f'\n[dim]Showing {len(keywords)} of {total} total keywords '
-            f'(min score: {min_score})[/dim]'
+        console.file.write(
+            f'\nShowing {len(keywords)} of {total} total keywords '
+            f'(min score: {min_score})\n'
         )
 
     def _keyword_summary_csv(self, keywords):
         """Output keyword summary as CSV to stdout."""
-        writer = csv.writer(sys.stdout)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
         writer.writerow([
             'Rank', 'Keyword', 'Score', 'Autocomplete Position',
             'Impressions', 'Clicks', 'Orders', 'Source',
         ])
-        for i, kw in enumerate(keywords, 1):
-            writer.writerow([
+        writer.writerows([
+            (
                 i,
                 kw['keyword'],
                 kw['score'] or 0,
@@ -157,11 +368,17 @@ class ReportingEngine:
                 kw['clicks'] or '',
                 kw['orders'] or '',
                 kw['source'] or '',
-            ])
+            )
+            for i, kw in enumerate(keywords, 1)
+        ])
+        _write_stdout(buf.getvalue())
 
     def _keyword_summary_json(self, keywords):
-        """Output keyword summary as JSON to stdout."""
-        import json
+        """Output keyword summary as JSON to stdout.
+
+        Indented for a terminal; compact when piped, where nobody reads
+        the whitespace.
+        """
         data = []
         for i, kw in enumerate(keywords, 1):
             data.append({
@@ -174,13 +391,17 @@ class ReportingEngine:
                 'orders': kw['orders'],
                 'source': kw['source'],
             })
-        print(json.dumps(data, indent=2))
+        # Serialize in one go; json.dump streams one write per token
+        tty = sys.stdout.isatty()
+        text = json.dumps(data, indent=2 if tty else None,
+                          separators=None if tty else (',', ':'))
+        _write_stdout(text + '\n')
 
     # ── Competitor Reports ────────────────────────────────────────
 
     def competitor_summary(self):
         """Print a rich table comparing all tracked books."""
-        books = self._book_repo.get_books_with_latest_snapshot()
+        books = self._book_repo.get_book_report_rows()
 
         if not books:
             console.print(
@@ -189,52 +410,26 @@ class ReportingEngine:
             )
             return
 
-        table = Table(
-            title='Competitor Comparison',
-            show_lines=True,
-            expand=True,
-        )
-        table.add_column('ASIN', width=12, no_wrap=True)
-        table.add_column('Title', ratio=3, no_wrap=False)
-        table.add_column('BSR', justify='right', width=9)
-        table.add_column('Price', justify='right', width=7)
-        table.add_column('Reviews', justify='right', width=8)
-        table.add_column('Rating', justify='center', width=6)
-        table.add_column('Sales/Day', justify='right', width=10)
-        table.add_column('Rev/Month', justify='right', width=10)
-
-        for book in books:
-            is_own = book['is_own']
-            style = 'bold green' if is_own else ''
-
-            bsr = _fmt_number(book['bsr_overall'])
-            price = _fmt_price(book['price_kindle'])
-            reviews = _fmt_number(book['review_count'])
-            rating = (f"{book['avg_rating']:.1f}"
-                      if book['avg_rating'] else '-')
-            daily_sales = (f"{book['estimated_daily_sales']:.1f}"
-                          if book['estimated_daily_sales'] else '-')
-            monthly_rev = _fmt_price(book['estimated_monthly_revenue'])
-
-            title = book['title'] or 'Unknown'
-            author = book['author'] or ''
-            display_title = f'{title}\nby {author}' if author else title
-            if is_own:
-                display_title = f'[bold]{display_title}[/bold]'
-
-            table.add_row(
-                book['asin'],
-                display_title,
-                bsr,
-                price,
-                reviews,
-                rating,
-                daily_sales,
-                monthly_rev,
-                style=style,
-            )
-
-        console.print(table)
+        table = _new_competitor_table()
+
+        rows = []
+        styles = []
+        for (asin, title, author, bsr, price, reviews, rating, daily_sales,
+             monthly_rev, is_own) in books:
+            rows.append((
+                asin,
+                _display_title(title, author, is_own),
+                _fmt_number(bsr),
+                _fmt_price(price),
+                _fmt_number(reviews),
+                f'{rating:.1f}' if rating else '-',
+                f'{daily_sales:.1f}' if daily_sales else '-',
+                _fmt_price(monthly_rev),
+            ))
+            styles.append(_OWN_ROW_STYLE[bool(is_own)])
+        _bulk_add_rows(table, rows, styles)
+
+        _print_buffered(table)
 
     # ── Keyword Gap Analysis ──────────────────────────────────────
 
@@ -249,38 +444,38 @@ class ReportingEngine:
         Args:
             competitor_asin: Optional ASIN to focus gap analysis on.
         """
+        out = []
         has_ranking_data = False
         has_ads_data = self._ads_repo.get_search_term_count() > 0
 
         # Check for ranking data from reverse ASIN
-        books = self._book_repo.get_all_books()
-        own_books = [b for b in books if b['is_own']]
-        competitor_books = [b for b in books if not b['is_own']]
-
-        own_ids = [b['id'] for b in own_books]
-        comp_ids = [b['id'] for b in competitor_books]
+        own_ids, comp_ids = self._partition_books()
 
         if competitor_asin:
             comp_book = self._book_repo.find_by_asin(competitor_asin)
             if comp_book:
                 comp_ids = [comp_book['id']]
 
+        # Both ranking sections compare own books against competitors;
+        # without one side there is nothing to query
+        if not own_ids or not comp_ids:
+            missing = ('your own books (track add --own)' if not own_ids
+                       else 'competitor books (track add)')
+            out.append(
+                f'[dim]Ranking gap analysis needs {missing}.[/dim]\n'
+            )
+
         # Section 1: Competitor keywords you don't rank for
         if own_ids and comp_ids:
             gaps = self._ranking_repo.get_gaps(own_ids, comp_ids)
             if gaps:
                 has_ranking_data = True
-                table = Table(
+                table = _new_table(
+                    _RANKING_GAP_COLUMNS,
                     title='Competitor Keywords You Don\'t Rank For',
                     show_lines=False,
                     expand=True,
                 )
-                table.add_column('#', style='dim', width=4, justify='right')
-                table.add_column('Keyword', style='bold', ratio=3)
-                table.add_column('Competitor', ratio=2)
-                table.add_column('Their Pos', justify='center', width=10)
-                table.add_column('Score', justify='right', width=7)
-                table.add_column('Priority', width=12)
 
                 for i, row in enumerate(gaps[:50], 1):
                     score = row['score'] or 0
@@ -288,11 +483,11 @@ class ReportingEngine:
 
                     # Prioritize: high score + good competitor position
                     if position <= 5 and score >= 50:
-                        priority = '[bold red]HIGH[/bold red]'
+                        priority = Text('HIGH', style=_STYLES['bold red'])
                     elif position <= 10 or score >= 25:
-                        priority = '[yellow]MEDIUM[/yellow]'
+                        priority = Text('MEDIUM', style=_STYLES['yellow'])
                     else:
-                        priority = '[dim]LOW[/dim]'
+                        priority = Text('LOW', style=_STYLES['dim'])
 
                     comp_title = row['competitor_title'] or row['competitor_asin']
                     if len(comp_title) > 30:
@@ -307,8 +502,8 @@ class ReportingEngine:
                         priority,
                     )
 
-                console.print(table)
-                console.print(
+                out.append(table)
+                out.append(
                     f'\n[dim]{len(gaps)} keyword gaps from competitor rankings[/dim]\n'
                 )
 
@@ -317,26 +512,21 @@ class ReportingEngine:
             position_gaps = self._find_position_gaps(own_ids, comp_ids)
             if position_gaps:
                 has_ranking_data = True
-                table = Table(
+                table = _new_table(
+                    _POSITION_GAP_COLUMNS,
                     title='Keywords Where Competitors Rank Higher',
                     show_lines=False,
                     expand=True,
                 )
-                table.add_column('#', style='dim', width=4, justify='right')
-                table.add_column('Keyword', style='bold', ratio=3)
-                table.add_column('Your Pos', justify='center', width=9)
-                table.add_column('Their Pos', justify='center', width=10)
-                table.add_column('Competitor', ratio=2)
-                table.add_column('Gap', justify='center', width=6)
-
-                for i, gap in enumerate(position_gaps[:30], 1):
+
+                for i, gap in enumerate(position_gaps, 1):
                     diff = gap['your_position'] - gap['their_position']
                     if diff >= 5:
-                        gap_str = f'[red]-{diff}[/red]'
+                        gap_str = Text(f'-{diff}', style=_STYLES['red'])
                     elif diff >= 2:
-                        gap_str = f'[yellow]-{diff}[/yellow]'
+                        gap_str = Text(f'-{diff}', style=_STYLES['yellow'])
                     else:
-                        gap_str = f'[dim]-{diff}[/dim]'
+                        gap_str = Text(f'-{diff}', style=_STYLES['dim'])
 
                     comp_title = gap['competitor_title'] or gap['competitor_asin']
                     if len(comp_title) > 30:
@@ -351,10 +541,10 @@ class ReportingEngine:
                         gap_str,
                     )
 
-                console.print(table)
-                console.print(
-                    f'\n[dim]{len(position_gaps)} keywords where competitors '
-                    f'outrank you[/dim]\n'
+                out.append(table)
+                out.append(
+                    f'\n[dim]{position_gaps[0]["total_count"]} keywords '
+                    f'where competitors outrank you[/dim]\n'
                 )
 
         # Section 3: Ads opportunity keywords (impressions but no orders)
@@ -362,17 +552,12 @@ class ReportingEngine:
             opportunities = self._ads_repo.get_opportunity_keywords()
 
             if opportunities:
-                table = Table(
+                table = _new_table(
+                    _ADS_OPPORTUNITY_COLUMNS,
                     title='Ads Keywords: Impressions but No Orders',
                     show_lines=False,
                     expand=True,
                 )
-                table.add_column('#', style='dim', width=4, justify='right')
-                table.add_column('Search Term', style='bold', ratio=3)
-                table.add_column('Impressions', justify='right', width=12)
-                table.add_column('Clicks', justify='right', width=8)
-                table.add_column('Spend', justify='right', width=10)
-                table.add_column('Action', width=20)
 
                 for i, row in enumerate(opportunities[:50], 1):
                     impressions = _fmt_number(row['total_impressions'])
@@ -383,39 +568,47 @@ class ReportingEngine:
                     total_impressions = row['total_impressions'] or 0
 
                     if total_clicks > 5 and total_impressions > 100:
-                        action = '[red]Review listing[/red]'
+                        action = Text('Review listing', style=_STYLES['red'])
                     elif total_impressions > 500 and total_clicks == 0:
-                        action = '[yellow]Improve ad copy[/yellow]'
+                        action = Text('Improve ad copy',
+                                      style=_STYLES['yellow'])
                     elif total_impressions < 50:
-                        action = '[dim]Low data[/dim]'
+                        action = Text('Low data', style=_STYLES['dim'])
                     else:
-                        action = '[yellow]Monitor[/yellow]'
+                        action = Text('Monitor', style=_STYLES['yellow'])
 
                     table.add_row(str(i), row['search_term'], impressions,
                                   clicks, spend, action)
 
-                console.print(table)
-                console.print(
+                out.append(table)
+                out.append(
                     f'\n[dim]{len(opportunities)} opportunity keywords from ads[/dim]\n'
                 )
 
-        # If no data at all
-        if not has_ranking_data and not has_ads_data:
+        if out:
+            _print_buffered(*out)
+
+        # If no data at all; a missing-books hint above already said why
+        if not has_ranking_data and not has_ads_data and own_ids and comp_ids:
             console.print(
                 '[yellow]No gap analysis data available.\n'
                 'Run "kdp-scout reverse <ASIN>" to get ranking data, or\n'
                 'use "kdp-scout import-ads <file>" to import ads data.[/yellow]'
             )
 
-    def _find_position_gaps(self, own_book_ids, competitor_book_ids):
+    def _find_position_gaps(self, own_book_ids, competitor_book_ids,
+                            limit=30):
         """Find keywords where competitors rank higher than own books.
 
         Args:
             own_book_ids: List of own book IDs.
             competitor_book_ids: List of competitor book IDs.
+            limit: Maximum number of rows to return.
 
         Returns:
-            List of dicts with position comparison data,
+            List of sqlite3.Row objects with keyword, your_position,
+            their_position, competitor_title, competitor_asin and
+            total_count (number of gaps before the limit was applied),
             sorted by gap size descending.
         """
         from kdp_scout.db import get_connection
@@ -430,7 +623,8 @@ class ReportingEngine:
                        own_kr.rank_position as your_position,
                        comp_kr.rank_position as their_position,
                        b.title as competitor_title,
-                       b.asin as competitor_asin
+                       b.asin as competitor_asin,
+                       COUNT(*) OVER () as total_count
                 FROM keyword_rankings own_kr
                 JOIN keyword_rankings comp_kr
                     ON own_kr.keyword_id = comp_kr.keyword_id
@@ -440,20 +634,10 @@ class ReportingEngine:
                   AND comp_kr.book_id IN ({comp_placeholders})
                   AND comp_kr.rank_position < own_kr.rank_position
                 ORDER BY (own_kr.rank_position - comp_kr.rank_position) DESC
+                LIMIT ?
             """
-            params = list(own_book_ids) + list(competitor_book_ids)
-            rows = conn.execute(query, params).fetchall()
-
-            return [
-                {
-                    'keyword': row['keyword'],
-                    'your_position': row['your_position'],
-                    'their_position': row['their_position'],
-                    'competitor_title': row['competitor_title'],
-                    'competitor_asin': row['competitor_asin'],
-                }
-                for row in rows
-            ]
+            params = [*own_book_ids, *competitor_book_ids, limit]
+            return conn.execute(query, params).fetchall()
         finally:
             conn.close()
 
@@ -473,36 +657,31 @@ class ReportingEngine:
             )
             return
 
-        terms = self._ads_repo.get_aggregated_search_terms()
+        terms = self._ads_repo.get_aggregated_search_terms(limit=100)
 
         if not terms:
             return
 
-        table = Table(
+        table = _new_table(
+            _ADS_PERFORMANCE_COLUMNS,
             title='Amazon Ads - Search Term Performance',
             show_lines=False,
             expand=True,
         )
-        table.add_column('#', style='dim', width=3, justify='right')
-        table.add_column('Search Term', style='bold', ratio=3, no_wrap=False)
-        table.add_column('Impr', justify='right', width=6)
-        table.add_column('Clk', justify='right', width=4)
-        table.add_column('CTR', justify='right', width=5)
-        table.add_column('Spend', justify='right', width=7)
-        table.add_column('Sales', justify='right', width=7)
-        table.add_column('ACOS', justify='right', width=5)
-        table.add_column('Ord', justify='right', width=4)
 
         total_spend = 0
         total_sales = 0
         total_orders = 0
 
-        for i, term in enumerate(terms[:100], 1):
-            impressions = _fmt_number(term['total_impressions'])
-            clicks = _fmt_number(term['total_clicks'])
+        for i, term in enumerate(terms, 1):
+            v = term['total_impressions']
+            impressions = '-' if v is None else f'{int(v):,}'
+            v = term['total_clicks']
+            clicks = '-' if v is None else f'{int(v):,}'
+            v = term['total_orders']
+            orders = '-' if v is None else f'{int(v):,}'
             spend = _fmt_price(term['total_spend'])
             sales = _fmt_price(term['total_sales'])
-            orders = _fmt_number(term['total_orders'])
 
             ctr = (f"{term['avg_ctr'] * 100:.1f}%"
                    if term['avg_ctr'] else '-')
@@ -510,12 +689,9 @@ class ReportingEngine:
             acos_val = term['avg_acos']
             if acos_val is not None:
                 acos_pct = acos_val * 100
-                if acos_pct > 100:
-                    acos_str = f'[red]{acos_pct:.0f}%[/red]'
-                elif acos_pct > 50:
-                    acos_str = f'[yellow]{acos_pct:.0f}%[/yellow]'
-                else:
-                    acos_str = f'[green]{acos_pct:.0f}%[/green]'
+                acos_str = Text(f'{acos_pct:.0f}%', style=_ACOS_STYLES[
+                    bisect_left(_ACOS_THRESHOLDS, acos_pct)
+                ])
             else:
                 acos_str = '-'
 
@@ -528,16 +704,15 @@ class ReportingEngine:
                 ctr, spend, sales, acos_str, orders,
             )
 
-        console.print(table)
-
         # Summary
         overall_acos = (total_spend / total_sales * 100
                         if total_sales > 0 else 0)
-        console.print(
+        _print_buffered(
+            table,
             f'\n[bold]Totals:[/bold] Spend: ${total_spend:,.2f} | '
             f'Sales: ${total_sales:,.2f} | '
             f'Orders: {total_orders:,} | '
-            f'ACOS: {overall_acos:.1f}%'
+            f'ACOS: {overall_acos:.1f}%',
         )
 
     # ── Trend Report ──────────────────────────────────────────────
@@ -551,7 +726,7 @@ class ReportingEngine:
         Args:
             days: Number of days to look back.
         """
-        keywords = self._kw_repo.get_keywords_with_latest_metrics(
+        keywords = self._cached_keywords(
             limit=100, min_score=0, order_by='score',
         )
 
@@ -562,23 +737,19 @@ class ReportingEngine:
             )
             return
 
-        table = Table(
+        table = _new_table(
+            _TREND_COLUMNS,
             title=f'Keyword Trends (Last {days} Days)',
             show_lines=False,
         )
-        table.add_column('#', style='dim', width=4, justify='right')
-        table.add_column('Keyword', style='bold', ratio=3)
-        table.add_column('Score', justify='right', width=7)
-        table.add_column('AC Pos Change', justify='center', width=14)
-        table.add_column('Impressions Change', justify='center', width=18)
-        table.add_column('Snapshots', justify='center', width=10)
 
         rows_with_changes = 0
+        histories = self._kw_repo.get_keyword_metrics_histories(
+            [kw['id'] for kw in keywords], days=days,
+        )
 
         for i, kw in enumerate(keywords, 1):
-            history = self._kw_repo.get_keyword_metrics_history(
-                kw['id'], days=days,
-            )
+            history = histories.get(kw['id'], [])
 
             if len(history) < 2:
                 # Only one snapshot, no trend to show
@@ -586,7 +757,9 @@ class ReportingEngine:
                 score = f"{kw['score']:.0f}" if kw['score'] else '0'
                 table.add_row(
                     str(i), kw['keyword'], score,
-                    '[dim]--[/dim]', '[dim]--[/dim]', snapshots,
+                    Text('--', style=_STYLES['dim']),
+                    Text('--', style=_STYLES['dim']),
+                    snapshots,
                 )
                 continue
 
@@ -599,13 +772,15 @@ class ReportingEngine:
             if old_pos and new_pos:
                 delta = old_pos - new_pos  # positive = improved (lower pos)
                 if delta > 0:
-                    pos_change = f'[green]+{delta} (improved)[/green]'
+                    pos_change = Text(f'+{delta} (improved)',
+                                      style=_STYLES['green'])
                 elif delta < 0:
-                    pos_change = f'[red]{delta} (declined)[/red]'
+                    pos_change = Text(f'{delta} (declined)',
+                                      style=_STYLES['red'])
                 else:
-                    pos_change = '[dim]unchanged[/dim]'
+                    pos_change = Text('unchanged', style=_STYLES['dim'])
             else:
-                pos_change = '[dim]--[/dim]'
+                pos_change = Text('--', style=_STYLES['dim'])
 
             # Impressions change
             old_imp = oldest['impressions']
@@ -613,13 +788,13 @@ class ReportingEngine:
             if old_imp is not None and new_imp is not None:
                 delta = new_imp - old_imp
                 if delta > 0:
-                    imp_change = f'[green]+{delta:,}[/green]'
+                    imp_change = Text(f'+{delta:,}', style=_STYLES['green'])
                 elif delta < 0:
-                    imp_change = f'[red]{delta:,}[/red]'
+                    imp_change = Text(f'{delta:,}', style=_STYLES['red'])
                 else:
-                    imp_change = '[dim]unchanged[/dim]'
+                    imp_change = Text('unchanged', style=_STYLES['dim'])
             else:
-                imp_change = '[dim]--[/dim]'
+                imp_change = Text('--', style=_STYLES['dim'])
 
             score = f"{kw['score']:.0f}" if kw['score'] else '0'
             snapshots = str(len(history))
@@ -630,9 +805,9 @@ class ReportingEngine:
             )
             rows_with_changes += 1
 
-        console.print(table)
-        console.print(
-            f'\n[dim]{len(keywords)} keywords analyzed over {days} days[/dim]'
+        _print_buffered(
+            table,
+            f'\n[dim]{len(keywords)} keywords analyzed over {days} days[/dim]',
         )
 
     # ── Export: Amazon Ads ────────────────────────────────────────
@@ -650,29 +825,43 @@ class ReportingEngine:
         Returns:
             The CSV content as a string (also printed to stdout).
         """
-        keywords = self._kw_repo.get_keywords_with_latest_metrics(
+        cursor = self._kw_repo.iter_keywords_with_latest_metrics(
             limit=500, min_score=min_score, order_by='score',
         )
+        batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
 
-        if not keywords:
+        if not batch:
             console.print(
                 '[yellow]No keywords meet the minimum score threshold. '
                 'Run "kdp-scout score" first, or lower --min-score.[/yellow]',
             )
             return ''
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(['Keyword', 'Match Type', 'Bid'])
-
-        for kw in keywords:
-            score = kw['score'] or 0
-            bid = _score_to_bid(score)
-            writer.writerow([kw['keyword'], 'broad', f'{bid:.2f}'])
-
-        content = output.getvalue()
-        print(content, end='')
-        return content
+        # Stream one batch of rows at a time: only a batch of sqlite rows is
+        # held in memory, and output starts before the query is exhausted.
+        chunks = []
+        header = True
+        while batch:
+            output = io.StringIO()
+            writer = csv.writer(output)
+            if header:
+                writer.writerow(['Keyword', 'Match Type', 'Bid'])
+                header = False
+
+            bids = _scores_to_bids([kw['score'] or 0 for kw in batch])
+            writer.writerows(zip(
+                [kw['keyword'] for kw in batch],
+                repeat('broad'),
+                [f'{bid:.2f}' for bid in bids],
+            ))
+
+            chunk = output.getvalue()
+            sys.stdout.write(chunk)
+            chunks.append(chunk)
+            batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
+
+        sys.stdout.flush()
+        return ''.join(chunks)
 
     # ── Export: KDP Backend Keywords ──────────────────────────────
 
@@ -684,7 +873,7 @@ class ReportingEngine:
 
         Prints the 7 slots ready to copy-paste into KDP dashboard.
         """
-        keywords = self._kw_repo.get_keywords_with_latest_metrics(
+        keywords = self._cached_keywords(
             limit=200, min_score=0, order_by='score',
         )
 
@@ -695,49 +884,13 @@ class ReportingEngine:
             )
             return
 
-        # Build list of (keyword_text, score, individual_words)
-        keyword_data = []
-        for kw in keywords:
-            text = kw['keyword'].strip()
-            score = kw['score'] or 0
-            words = text.split()
-            keyword_data.append((text, score, words))
-
-        # Greedy packing algorithm: only add NEW words from each keyword
-        slots = [[] for _ in range(KDP_SLOT_COUNT)]
-        slot_bytes = [0] * KDP_SLOT_COUNT
-        used_words = set()  # Track all words used across all slots
-        total_score = 0
-
-        for text, score, words in keyword_data:
-            # Find which words from this keyword are new
-            new_words = [w for w in words if w.lower() not in used_words]
-            if not new_words:
-                continue  # Skip - all words already covered
-
-            # Only add the new words (Amazon treats backend keywords as
-            # a bag of words, so order doesn't matter)
-            phrase_to_add = ' '.join(new_words)
-            phrase_bytes = len(phrase_to_add.encode('utf-8'))
-
-            # Try to fit in a slot
-            placed = False
-            for slot_idx in range(KDP_SLOT_COUNT):
-                current_bytes = slot_bytes[slot_idx]
-                separator_bytes = 1 if slots[slot_idx] else 0  # space separator
-                needed = phrase_bytes + separator_bytes
-
-                if current_bytes + needed <= KDP_SLOT_MAX_BYTES:
-                    slots[slot_idx].append(phrase_to_add)
-                    slot_bytes[slot_idx] += needed
-                    for w in new_words:
-                        used_words.add(w.lower())
-                    total_score += score
-                    placed = True
-                    break
+        slots, used_words, total_score = _pack_backend_keywords(
+            (kw['keyword'], kw['score'] or 0) for kw in keywords
+        )
 
         # Display results
-        console.print(
+        out = []
+        out.append(
             Panel(
                 '[bold]KDP Backend Keywords[/bold]\n'
                 'Copy each slot into your KDP dashboard backend keywords.\n'
@@ -746,11 +899,11 @@ class ReportingEngine:
                 border_style='cyan',
             )
         )
-        console.print()
+        out.append('')
 
         for i, slot in enumerate(slots, 1):
             content = ' '.join(slot)
-            byte_count = len(content.encode('utf-8'))
+            byte_count = _utf8_len(content)
 
             if content:
                 bar_len = int(byte_count / KDP_SLOT_MAX_BYTES * 20)
@@ -761,22 +914,23 @@ class ReportingEngine:
                 else:
                     byte_color = 'green'
 
-                console.print(
+                out.append(
                     f'[bold]Slot {i}:[/bold] [{byte_color}]'
                     f'{byte_count}/{KDP_SLOT_MAX_BYTES} bytes[/{byte_color}] '
                     f'[dim][{bar}][/dim]'
                 )
-                console.print(f'  {content}')
+                out.append(f'  {content}')
             else:
-                console.print(f'[bold]Slot {i}:[/bold] [dim](empty)[/dim]')
-            console.print()
+                out.append(f'[bold]Slot {i}:[/bold] [dim](empty)[/dim]')
+            out.append('')
 
-        console.print(
+        out.append(
             f'[bold]Total unique words:[/bold] {len(used_words)}'
         )
-        console.print(
+        out.append(
             f'[bold]Total score packed:[/bold] {total_score:.0f}'
         )
+        _print_buffered(*out)
 
     # ── Export: Semantic KDP Backend Keywords ──────────────────────
 
@@ -795,7 +949,7 @@ class ReportingEngine:
         """
         from kdp_scout.keyword_engine import generate_semantic_phrases
 
-        keywords = self._kw_repo.get_keywords_with_latest_metrics(
+        keywords = self._cached_keywords(
             limit=200, min_score=0, order_by='score',
         )
 
@@ -843,7 +997,7 @@ class ReportingEngine:
 
         for phrase_data in phrases:
             phrase = phrase_data['phrase'].strip()
-            phrase_byte_len = len(phrase.encode('utf-8'))
+            phrase_byte_len = _utf8_len(phrase)
 
             if phrase_byte_len > KDP_SLOT_MAX_BYTES:
                 # Skip phrases that are too long for a single slot
@@ -866,11 +1020,12 @@ class ReportingEngine:
                     break
 
         # Display semantic version
-        console.print('[bold green]SEMANTIC (A10-Optimized) Slots:[/bold green]')
-        console.print()
+        out = []
+        out.append('[bold green]SEMANTIC (A10-Optimized) Slots:[/bold green]')
+        out.append('')
 
         for i, slot in enumerate(slots, 1):
-            byte_count = len(slot.encode('utf-8')) if slot else 0
+            byte_count = _utf8_len(slot)
 
             if slot:
                 bar_len = int(byte_count / KDP_SLOT_MAX_BYTES * 20)
@@ -881,23 +1036,21 @@ class ReportingEngine:
                 else:
                     byte_color = 'green'
 
-                console.print(
+                out.append(
                     f'[bold]Slot {i}:[/bold] [{byte_color}]'
                     f'{byte_count}/{KDP_SLOT_MAX_BYTES} bytes[/{byte_color}] '
                     f'[dim][{bar}][/dim]'
                 )
-                console.print(f'  {slot}')
+                out.append(f'  {slot}')
             else:
-                console.print(f'[bold]Slot {i}:[/bold] [dim](empty)[/dim]')
-            console.print()
+                out.append(f'[bold]Slot {i}:[/bold] [dim](empty)[/dim]')
+            out.append('')
 
         # Show cluster breakdown
-        console.print('[bold]Phrase Details:[/bold]')
-        detail_table = Table(show_lines=False, expand=True)
-        detail_table.add_column('#', style='dim', width=3, justify='right')
-        detail_table.add_column('Phrase', style='bold', ratio=3)
-        detail_table.add_column('Relevance', justify='center', width=10)
-        detail_table.add_column('Cluster', ratio=2)
+        out.append('[bold]Phrase Details:[/bold]')
+        detail_table = _new_table(
+            _PHRASE_DETAIL_COLUMNS, show_lines=False, expand=True,
+        )
 
         for i, p in enumerate(used_phrases, 1):
             rel = p['relevance']
@@ -915,22 +1068,121 @@ class ReportingEngine:
                 p.get('cluster_label', '-'),
             )
 
-        console.print(detail_table)
-        console.print()
+        out.append(detail_table)
+        out.append('')
 
         # Now show original word-packed version for comparison
-        console.print(
+        out.append(
             '[bold yellow]COMPARISON - Original word-packed slots:[/bold yellow]'
         )
-        console.print()
+        out.append('')
+        _print_buffered(*out)
         self.export_backend_keywords()
 
 
 # ── Utility functions ─────────────────────────────────────────────
 
 
+def _write_stdout(text):
+    """Write fully-built output to stdout with a single write and flush."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _print_buffered(*renderables):
+    """Render to an in-memory buffer and write it to the console in one go.
+
+    A large table printed directly goes out as many small writes; rendering
+    off-screen first turns that into a single write, which matters most
+    when output is piped to a file.
+
+    Args:
+        *renderables: Objects accepted by Console.print, printed in order.
+    """
+    buf = io.StringIO()
+    tmp = Console(
+        file=buf,
+        width=console.width,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+    )
+    for renderable in renderables:
+        tmp.print(renderable)
+    console.file.write(buf.getvalue())
+    console.file.flush()
+
+
+def _bulk_add_rows(table, rows, styles=None):
+    """Append many rows to a Rich Table in one pass.
+
+    Equivalent to calling ``table.add_row(*row, style=style)`` for each
+    row, but fills each column's cell list with a single extend instead
+    of dispatching every cell through add_row. Every row must have
+    exactly one cell per column.
+
+    Args:
+        table: A Rich Table whose columns have already been added.
+        rows: List of tuples of cell renderables (None for a blank cell).
+        styles: Optional list of row styles, parallel to rows.
+    """
+    from rich.table import Row
+
+    for column, cells in zip(table.columns, zip(*rows)):
+        column._cells.extend('' if cell is None else cell for cell in cells)
+    if styles is None:
+        styles = [None] * len(rows)
+    table.rows.extend(Row(style=style) for style in styles)
+
+
+def _new_table(columns, **table_kwargs):
+    """Build an empty Rich Table from a module-level column spec.
+
+    Args:
+        columns: Sequence of (header, add_column kwargs) pairs.
+        **table_kwargs: Passed through to Table().
+
+    Returns:
+        A Table with columns added and no rows. Long-running callers can
+        reuse it by clearing ``table.rows`` and adding fresh rows.
+    """
+    from rich.table import Table
+
+    table = Table(**table_kwargs)
+    for header, column_kwargs in columns:
+        table.add_column(header, **column_kwargs)
+    return table
+
+
+def _new_keyword_table():
+    """Build the empty 'Top Keywords' table."""
+    return _new_table(
+        _KEYWORD_COLUMNS, title='Top Keywords (by Score)',
+        show_lines=False, expand=True,
+    )
+
+
+def _new_competitor_table():
+    """Build the empty 'Competitor Comparison' table."""
+    return _new_table(
+        _COMPETITOR_COLUMNS, title='Competitor Comparison',
+        show_lines=False, expand=True,
+    )
+
+
+def _display_title(title, author, is_own):
+    """Build the single-line 'title — author' cell for a book row."""
+    return _TITLE_FMT[bool(is_own), bool(author)].format(
+        title or 'Unknown', author,
+    )
+
+
+@lru_cache(maxsize=4096)
 def _fmt_number(value):
-    """Format a number with comma separators, or '-' if None."""
+    """Format a number with comma separators, or '-' if None.
+
+    Per-row loops in the larger reports format inline instead; this is
+    for the smaller tables and one-off values.
+    """
     if value is None:
         return '-'
     return f'{int(value):,}'
@@ -940,7 +1192,118 @@ def _fmt_price(value):
     """Format a price as $X.XX, or '-' if None or zero."""
     if value is None or value == 0:
         return '-'
-    return f'${value:,.2f}'
+    if value < 0 or not math.isfinite(value):
+        # Rare enough to skip the cache; keeps the '$-12.50' / '$nan' forms
+        return f'${value:,.2f}'
+    # round() to 2 places rounds exactly as '.2f' does; the + 0.5 only
+    # absorbs float noise in the * 100 so int() lands on the whole cent
+    return _fmt_cents(int(round(value, 2) * 100 + 0.5))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_cents(cents):
+    """Format a non-negative integer number of cents as $X.XX."""
+    dollars, cents = divmod(cents, 100)
+    return f'${dollars:,}.{cents:02d}'
+
+
+def _write_plain_table(headers, rows, right_aligned):
+    """Write rows as fixed-width plain text straight to the console file.
+
+    Column widths are taken from the headers and the first
+    PLAIN_WIDTH_SAMPLE rows; longer cells further down simply overflow.
+
+    Args:
+        headers: Tuple of column header strings.
+        rows: List of tuples of cell strings.
+        right_aligned: Tuple of booleans, one per column.
+    """
+    widths = [len(h) for h in headers]
+    for row in rows[:PLAIN_WIDTH_SAMPLE]:
+        for col, cell in enumerate(row):
+            if len(cell) > widths[col]:
+                widths[col] = len(cell)
+
+    def fmt(row):
+        return '  '.join(
+            cell.rjust(width) if right else cell.ljust(width)
+            for cell, width, right in zip(row, widths, right_aligned)
+        ).rstrip() + '\n'
+
+    write = console.file.write
+    write(fmt(headers))
+    write('  '.join('-' * w for w in widths) + '\n')
+    for row in rows:
+        write(fmt(row))
+
+
+def _utf8_len(text):
+    """Return the UTF-8 byte length of text.
+
+    ASCII text, the common case for keywords, is measured without
+    allocating an encoded copy.
+    """
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def _pack_backend_keywords(scored_keywords):
+    """Pack keywords into KDP backend slots, skipping already-used words.
+
+    Keywords are taken in the given order (highest score first). Only the
+    lowercased words not yet used in any slot are added, since Amazon
+    treats backend keywords as a case-insensitive bag of words. Each phrase goes into the best-fitting
+    slot: the one with the least room left that can still hold it, which
+    leaves larger gaps open for later phrases.
+
+    Args:
+        scored_keywords: Iterable of (keyword_text, score) pairs.
+
+    Returns:
+        Tuple of (slots, used_words, total_score) where slots is a list of
+        KDP_SLOT_COUNT lists of phrases and used_words is the set of
+        lowercased words packed.
+    """
+    # Lowercase each keyword's words once up front. Keywords are stored
+    # lowercased already, and KDP matching is case-insensitive, so the
+    # lowercased words are also what gets packed.
+    keyword_data = [
+        (score, tuple(text.lower().split())) for text, score in scored_keywords
+    ]
+
+    slots = [[] for _ in range(KDP_SLOT_COUNT)]
+    slot_bytes = [0] * KDP_SLOT_COUNT
+    used_words = set()  # Track all words used across all slots
+    total_score = 0
+
+    for score, words in keyword_data:
+        # Find which words from this keyword are new
+        new_words = [w for w in words if w not in used_words]
+        if not new_words:
+            continue  # Skip - all words already covered
+
+        phrase_to_add = ' '.join(new_words)
+        phrase_bytes = _utf8_len(phrase_to_add)
+
+        # Best fit: the slot with the least remaining room that still fits
+        best_idx = None
+        best_remaining = None
+        for slot_idx in range(KDP_SLOT_COUNT):
+            separator_bytes = 1 if slots[slot_idx] else 0  # space separator
+            remaining = (KDP_SLOT_MAX_BYTES - slot_bytes[slot_idx]
+                         - phrase_bytes - separator_bytes)
+            if remaining >= 0 and (best_remaining is None
+                                   or remaining < best_remaining):
+                best_idx = slot_idx
+                best_remaining = remaining
+
+        if best_idx is not None:
+            separator_bytes = 1 if slots[best_idx] else 0
+            slots[best_idx].append(phrase_to_add)
+            slot_bytes[best_idx] += phrase_bytes + separator_bytes
+            used_words.update(new_words)
+            total_score += score
+
+    return slots, used_words, total_score
 
 
 def _score_to_bid(score):
@@ -952,7 +1315,42 @@ def _score_to_bid(score):
     Returns:
         Suggested bid in dollars.
     """
-    for threshold, bid in BID_TIERS:
-        if score >= threshold:
-            return bid
-    return BID_TIERS[-1][1]
+    # Scores below the lowest threshold, and NaN, fall into the lowest tier
+    if not score >= _BID_THRESHOLDS[0]:
+        return BID_TIERS[-1][1]
+    return _BID_VALUES[bisect_right(_BID_THRESHOLDS, score) - 1]
+
+
+def _scores_to_bids(scores):
+    """Vectorized _score_to_bid over a sequence of scores.
+
+    Args:
+        scores: Sequence of keyword composite scores.
+
+    Returns:
+        List of suggested bids in dollars, parallel to scores.
+    """
+    import numpy as np
+
+    thresholds, tier_bids = _bid_tier_arrays()
+    values = np.asarray(scores, dtype=np.float64)
+    # searchsorted sorts NaN after everything; send it to the lowest tier
+    values = np.where(np.isnan(values), -np.inf, values)
+    idx = np.searchsorted(thresholds, values, side='right') - 1
+    return tier_bids[np.clip(idx, 0, None)].tolist()
+
+
+@lru_cache(maxsize=None)
+def _bid_tier_arrays():
+    """Return BID_TIERS as (thresholds, bids) float64 arrays, ascending.
+
+    Built once on first use so numpy is only imported by the export paths
+    that need it.
+    """
+    import numpy as np
+
+    thresholds = np.array(_BID_THRESHOLDS, dtype=np.float64)
+    tier_bids = np.array(_BID_VALUES, dtype=np.float64)
+    thresholds.flags.writeable = False
+    tier_bids.flags.writeable = False
+    return thresholds, tier_bids
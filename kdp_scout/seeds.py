@@ -6,6 +6,9 @@ on a schedule. Seeds are persisted to a JSON file in the data/ directory.
 
 import json
 import logging
+import os
+import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -13,28 +16,118 @@ from kdp_scout.config import Config
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional speedup; both paths read and write the same
+# JSON as bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj, pretty=False):
+    if orjson is not None:
+        if pretty:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _normalize(keyword):
+    """Normalize a seed keyword for storage and lookup.
+
+    The result is interned, so the index and keyword column share one
+    string object per keyword.
+    """
+    return sys.intern(keyword.lower().strip())
+
+
+def _iso_now():
+    """Current local time as an ISO 8601 string, for seed timestamps."""
+    return datetime.now().isoformat()
+
+
 # Default seeds file location (relative to project root)
 _project_root = Path(__file__).parent.parent
 DEFAULT_SEEDS_FILE = _project_root / 'data' / 'seeds.json'
 
+# Parsed seed records per seeds file, keyed on (mtime_ns, size), so
+# several SeedManagers in one process parse an unchanged file only once.
+# _set_rows copies the records into fresh columns and never mutates them.
+_LOAD_CACHE = {}
+
+# Fields of a seed record and their defaults. In memory each field is a
+# column (one list per field, one row per seed); the file keeps one
+# object per seed.
+SEED_FIELDS = {
+    'keyword': None,
+    'department': 'kindle',
+    'added_at': None,
+    'last_added': None,
+    'last_mined': None,
+    'mine_count': 0,
+}
+
 
 class SeedManager:
     """Manage seed keywords for automated re-mining.
 
     Seeds are stored as a JSON file with keyword text, department,
-    and metadata about when they were added and last mined.
+    and metadata about when they were added and last mined. The file is
+    JSON Lines: a header object on the first line, then one compact
+    seed object per line. Files in the older single-document format
+    (still written with pretty=True) load as well. In memory
+    they are held column-wise, so lookups that only need keywords and
+    departments don't walk every field of every seed.
     """
 
-    def __init__(self, seeds_file=None):
+    def __init__(self, seeds_file=None, pretty=False):
         """Initialize the seed manager.
 
+        The seeds file is not read until seeds are first accessed.
+
         Args:
             seeds_file: Path to the seeds JSON file.
                         Defaults to data/seeds.json in the project root.
+            pretty: If True, save as one indented JSON document instead
+                    of JSON Lines, for reading the file by hand.
         """
         self.seeds_file = Path(seeds_file) if seeds_file else DEFAULT_SEEDS_FILE
-        self._seeds = []
-        self.load()
+        self.pretty = pretty
+        self._cols = None  # field -> list; loaded on first access
+        self._index = {}  # keyword -> row number, for O(1) lookups
+        self._dirty = False
+        self._batch_depth = 0
+
+    def _ensure_loaded(self):
+        """Read the seeds file the first time seeds are needed."""
+        if self._cols is None:
+            self.load()
+
+    def _set_rows(self, seeds):
+        """Replace all seeds with the given seed dicts.
+
+        If a keyword appears more than once, the first record wins.
+        """
+        unique = {}
+        for seed in seeds:
+            unique.setdefault(sys.intern(seed['keyword']), seed)
+        seeds = unique.values()
+        self._cols = {
+            field: [seed.get(field, default) for seed in seeds]
+            for field, default in SEED_FIELDS.items()
+        }
+        self._cols['keyword'] = list(unique)
+        self._index = {
+            keyword: row for row, keyword in enumerate(self._cols['keyword'])
+        }
 
     def add_seed(self, keyword, department='kindle'):
         """Add a seed keyword to the persistent list.
@@ -49,28 +142,52 @@ class SeedManager:
         Returns:
             True if the seed was newly added, False if updated.
         """
-        keyword_lower = keyword.lower().strip()
+        self._ensure_loaded()
+        return self._add_seed(keyword, department, _iso_now())
+
+    def add_seeds(self, keywords, department='kindle'):
+        """Add many seed keywords, saving once at the end.
+
+        Args:
+            keywords: Iterable of seed keyword texts.
+            department: Amazon department for all of them.
+
+        Returns:
+            Number of seeds newly added (existing ones are updated).
+        """
+        self._ensure_loaded()
+        now = _iso_now()
+        with self.batch():
+            return sum(
+                self._add_seed(keyword, department, now)
+                for keyword in keywords
+            )
+
+    def _add_seed(self, keyword, department, now):
+        """Add or update one seed, stamped with the given ISO timestamp."""
+        keyword_lower = _normalize(keyword)
         if not keyword_lower:
             return False
 
+        cols = self._cols
+
         # Check for existing seed
-        for seed in self._seeds:
-            if seed['keyword'] == keyword_lower:
-                seed['department'] = department
-                seed['last_added'] = datetime.now().isoformat()
-                self.save()
-                logger.info(f'Updated seed keyword: "{keyword_lower}"')
-                return False
+        row = self._index.get(keyword_lower)
+        if row is not None:
+            cols['department'][row] = department
+            cols['last_added'][row] = now
+            self.save()
+            logger.info(f'Updated seed keyword: "{keyword_lower}"')
+            return False
 
         # Add new seed
-        self._seeds.append({
-            'keyword': keyword_lower,
-            'department': department,
-            'added_at': datetime.now().isoformat(),
-            'last_added': datetime.now().isoformat(),
-            'last_mined': None,
-            'mine_count': 0,
-        })
+        self._index[keyword_lower] = len(cols['keyword'])
+        cols['keyword'].append(keyword_lower)
+        cols['department'].append(department)
+        cols['added_at'].append(now)
+        cols['last_added'].append(now)
+        cols['last_mined'].append(None)
+        cols['mine_count'].append(0)
         self.save()
         logger.info(f'Added seed keyword: "{keyword_lower}" ({department})')
         return True
@@ -84,16 +201,20 @@ class SeedManager:
         Returns:
             True if removed, False if not found.
         """
-        keyword_lower = keyword.lower().strip()
-        original_count = len(self._seeds)
-        self._seeds = [
-            s for s in self._seeds if s['keyword'] != keyword_lower
-        ]
-        if len(self._seeds) < original_count:
-            self.save()
-            logger.info(f'Removed seed keyword: "{keyword_lower}"')
-            return True
-        return False
+        self._ensure_loaded()
+        keyword_lower = _normalize(keyword)
+        row = self._index.pop(keyword_lower, None)
+        if row is None:
+            return False
+
+        for column in self._cols.values():
+            del column[row]
+        # Seeds after the removed one shift up a row
+        for keyword in self._cols['keyword'][row:]:
+            self._index[keyword] -= 1
+        self.save()
+        logger.info(f'Removed seed keyword: "{keyword_lower}"')
+        return True
 
     def mark_mined(self, keyword):
         """Mark a seed as having been mined.
@@ -103,13 +224,14 @@ class SeedManager:
         Args:
             keyword: The seed keyword text.
         """
-        keyword_lower = keyword.lower().strip()
-        for seed in self._seeds:
-            if seed['keyword'] == keyword_lower:
-                seed['last_mined'] = datetime.now().isoformat()
-                seed['mine_count'] = seed.get('mine_count', 0) + 1
-                self.save()
-                return
+        self._ensure_loaded()
+        row = self._index.get(_normalize(keyword))
+        if row is not None:
+            self._cols['last_mined'][row] = _iso_now()
+            self._cols['mine_count'][row] = (
+                (self._cols['mine_count'][row] or 0) + 1
+            )
+            self.save()
 
     def list_seeds(self):
         """Get all seed keywords.
@@ -118,7 +240,12 @@ class SeedManager:
             List of seed dicts with keys: keyword, department, added_at,
             last_added, last_mined, mine_count.
         """
-        return list(self._seeds)
+        self._ensure_loaded()
+        cols = self._cols
+        return [
+            dict(zip(SEED_FIELDS, row))
+            for row in zip(*(cols[field] for field in SEED_FIELDS))
+        ]
 
     def get_seeds_for_mining(self, department=None):
         """Get seed keywords filtered for mining.
@@ -129,26 +256,75 @@ class SeedManager:
         Returns:
             List of (keyword, department) tuples.
         """
-        results = []
-        for seed in self._seeds:
-            if department and seed['department'] != department:
-                continue
-            results.append((seed['keyword'], seed['department']))
-        return results
+        self._ensure_loaded()
+        return [
+            (keyword, dept)
+            for keyword, dept in zip(
+                self._cols['keyword'], self._cols['department'],
+            )
+            if not department or dept == department
+        ]
+
+    @contextmanager
+    def batch(self):
+        """Defer saves until the outermost batch exits.
+
+        Changes made inside the block are written to disk once, on exit,
+        instead of rewriting the whole file after every change::
+
+            with manager.batch():
+                for keyword in keywords:
+                    manager.add_seed(keyword)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save_now()
 
     def save(self):
-        """Persist seeds to JSON file."""
+        """Persist seeds to JSON file, or defer it inside a batch."""
+        self._dirty = True
+        if self._batch_depth:
+            return
+        self._save_now()
+
+    def _save_now(self):
+        """Write seeds to the JSON file immediately."""
         # Ensure directory exists
         self.seeds_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.seeds_file, 'w') as f:
-            json.dump({
-                'seeds': self._seeds,
-                'last_updated': datetime.now().isoformat(),
+        seeds = self.list_seeds()
+        if self.pretty:
+            payload = _dumps({
+                'seeds': seeds,
+                'last_updated': _iso_now(),
                 'version': 1,
-            }, f, indent=2)
-
-        logger.debug(f'Saved {len(self._seeds)} seeds to {self.seeds_file}')
+            }, pretty=True)
+        else:
+            header = {'version': 2, 'last_updated': _iso_now()}
+            payload = b''.join(
+                [_dumps(header), b'\n']
+                + [_dumps(seed) + b'\n' for seed in seeds]
+            )
+
+        # Write beside the target and rename over it, so a reader (or a
+        # crash mid-write) never sees a half-written seeds file
+        tmp = self.seeds_file.with_name(self.seeds_file.name + '.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp, self.seeds_file)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        finally:
+            _LOAD_CACHE.pop(self.seeds_file, None)
+
+        self._dirty = False
+        logger.debug(f'Saved {len(self)} seeds to {self.seeds_file}')
 
     def load(self):
         """Load seeds from JSON file.
@@ -156,21 +332,45 @@ class SeedManager:
         If the file doesn't exist, starts with an empty seed list.
         """
         if not self.seeds_file.exists():
-            self._seeds = []
+            self._set_rows([])
             logger.debug(f'No seeds file found at {self.seeds_file}')
             return
 
         try:
-            with open(self.seeds_file, 'r') as f:
-                data = json.load(f)
-            self._seeds = data.get('seeds', [])
-            logger.debug(f'Loaded {len(self._seeds)} seeds from {self.seeds_file}')
+            with open(self.seeds_file, 'rb') as f:
+                # fstat the open file, so the key matches what gets read
+                # even if a save replaces the file in between
+                st = os.fstat(f.fileno())
+                key = (st.st_mtime_ns, st.st_size)
+                cached = _LOAD_CACHE.get(self.seeds_file)
+                if cached is not None and cached[0] == key:
+                    seeds = cached[1]
+                else:
+                    seeds = self._parse(f)
+                    _LOAD_CACHE[self.seeds_file] = (key, seeds)
+            self._set_rows(seeds)
+            logger.debug(f'Loaded {len(self)} seeds from {self.seeds_file}')
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f'Failed to load seeds file: {e}')
-            self._seeds = []
+            self._set_rows([])
+
+    @staticmethod
+    def _parse(f):
+        """Parse seed dicts from an open seeds file, either format."""
+        first = f.readline()
+        try:
+            header = _loads(first)
+        except json.JSONDecodeError:
+            header = None  # first line of an indented document
+        if isinstance(header, dict) and 'seeds' not in header:
+            # JSON Lines: one seed per line after the header
+            return [_loads(line) for line in f if line.strip()]
+        return _loads(first + f.read()).get('seeds', [])
 
     def __len__(self):
-        return len(self._seeds)
+        self._ensure_loaded()
+        return len(self._cols['keyword'])
 
     def __repr__(self):
-        return f'SeedManager({len(self._seeds)} seeds)'
+        return f'SeedManager({len(self)} seeds)'
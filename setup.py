@@ -18,12 +18,16 @@ setup(
         'rich',
         'python-dotenv',
         'pandas',
+        'numpy',
     ],
     extras_require={
         'dev': [
             'pytest',
             'pytest-cov',
         ],
+        'fast': [
+            'orjson',
+        ],
     },
     entry_points={
         'console_scripts': [
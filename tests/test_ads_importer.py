@@ -1,112 +1,101 @@
 """Tests for Amazon Ads CSV importer parsing functions."""
 
+import pandas as pd
 import pytest
-from kdp_scout.collectors.ads_importer import AdsImporter, COLUMN_ALIASES
+from kdp_scout.collectors.ads_importer import (
+    AdsImporter, ALIAS_TO_CANONICAL, COLUMN_ALIASES,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def importer():
     """Create an AdsImporter without database initialization."""
-    # We only test the pure parsing methods, not the DB-dependent ones
+    # We only test the pure parsing methods, not the DB-dependent ones.
+    # They never touch instance state, so one instance serves every test.
     obj = object.__new__(AdsImporter)
     return obj
 
 
 class TestParseInt:
-    def test_simple_integer(self, importer):
-        assert importer._parse_int('123') == 123
-
-    def test_with_commas(self, importer):
-        assert importer._parse_int('1,234') == 1234
-
-    def test_with_spaces(self, importer):
-        assert importer._parse_int('  123  ') == 123
-
-    def test_dash_returns_none(self, importer):
-        assert importer._parse_int('-') is None
-
-    def test_empty_returns_none(self, importer):
-        assert importer._parse_int('') is None
-
-    def test_none_returns_none(self, importer):
-        assert importer._parse_int(None) is None
-
-    def test_float_string_truncates(self, importer):
-        assert importer._parse_int('12.5') == 12
-
-    def test_invalid_string_returns_none(self, importer):
-        assert importer._parse_int('abc') is None
-
-    def test_large_number(self, importer):
-        assert importer._parse_int('1,234,567') == 1234567
-
-    def test_zero(self, importer):
-        assert importer._parse_int('0') == 0
+    @pytest.mark.parametrize('value, expected', [
+        ('123', 123),
+        ('1,234', 1234),
+        ('  123  ', 123),
+        ('-', None),
+        ('', None),
+        (None, None),
+        ('12.5', 12),  # float strings truncate
+        ('abc', None),
+        ('1,234,567', 1234567),
+        ('0', 0),
+    ])
+    def test_parse_int(self, importer, value, expected):
+        assert importer._parse_int(value) == expected
 
 
 class TestParsePercentage:
-    def test_with_percent_sign(self, importer):
-        assert importer._parse_percentage('12.5%') == pytest.approx(0.125)
-
-    def test_decimal_form(self, importer):
-        assert importer._parse_percentage('0.125') == pytest.approx(0.125)
-
-    def test_whole_number_percentage(self, importer):
-        # Value > 1 is treated as a percentage
-        assert importer._parse_percentage('12.5') == pytest.approx(0.125)
-
-    def test_fifty_percent(self, importer):
-        assert importer._parse_percentage('50%') == pytest.approx(0.5)
-
-    def test_half_as_decimal(self, importer):
-        assert importer._parse_percentage('0.5') == pytest.approx(0.5)
-
-    def test_hundred_percent(self, importer):
-        assert importer._parse_percentage('100%') == pytest.approx(1.0)
-
-    def test_dash_returns_none(self, importer):
-        assert importer._parse_percentage('-') is None
-
-    def test_empty_returns_none(self, importer):
-        assert importer._parse_percentage('') is None
-
-    def test_none_returns_none(self, importer):
-        assert importer._parse_percentage(None) is None
-
-    def test_invalid_returns_none(self, importer):
-        assert importer._parse_percentage('abc') is None
-
-    def test_zero_percent(self, importer):
-        assert importer._parse_percentage('0%') == 0.0
+    @pytest.mark.parametrize('value, expected', [
+        ('12.5%', 0.125),
+        ('0.125', 0.125),  # decimal form
+        ('12.5', 0.125),  # value > 1 is treated as a percentage
+        ('50%', 0.5),
+        ('0.5', 0.5),
+        ('100%', 1.0),
+        ('-', None),
+        ('', None),
+        (None, None),
+        ('abc', None),
+        ('0%', 0.0),
+    ])
+    def test_parse_percentage(self, importer, value, expected):
+        result = importer._parse_percentage(value)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == pytest.approx(expected)
 
 
 class TestParseCurrency:
-    def test_with_dollar_sign(self, importer):
-        assert importer._parse_currency('$12.50') == pytest.approx(12.50)
-
-    def test_without_dollar_sign(self, importer):
-        assert importer._parse_currency('12.50') == pytest.approx(12.50)
-
-    def test_with_commas(self, importer):
-        assert importer._parse_currency('$1,234.56') == pytest.approx(1234.56)
-
-    def test_dash_returns_none(self, importer):
-        assert importer._parse_currency('-') is None
-
-    def test_empty_returns_none(self, importer):
-        assert importer._parse_currency('') is None
-
-    def test_none_returns_none(self, importer):
-        assert importer._parse_currency(None) is None
-
-    def test_invalid_returns_none(self, importer):
-        assert importer._parse_currency('abc') is None
-
-    def test_zero(self, importer):
-        assert importer._parse_currency('$0.00') == pytest.approx(0.0)
-
-    def test_whole_dollar(self, importer):
-        assert importer._parse_currency('$5') == pytest.approx(5.0)
+    @pytest.mark.parametrize('value, expected', [
+        ('$12.50', 12.50),
+        ('12.50', 12.50),
+        ('$1,234.56', 1234.56),
+        ('-', None),
+        ('', None),
+        (None, None),
+        ('abc', None),
+        ('$0.00', 0.0),
+        ('$5', 5.0),
+    ])
+    def test_parse_currency(self, importer, value, expected):
+        result = importer._parse_currency(value)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == pytest.approx(expected)
+
+
+class TestSeriesParsers:
+    """Column-wise parsers must agree with the scalar parsers."""
+
+    RAW = ['123', '1,234', '  7 ', '-', '', '12.5', 'abc', '$12.50',
+           '$1,234.56', '12.5%', '0.5', '50%', '0%', None]
+
+    @pytest.mark.parametrize('kind', ['int', 'percentage', 'currency'])
+    def test_matches_scalar(self, importer, kind):
+        scalar = getattr(importer, f'_parse_{kind}')
+        series_parser = getattr(importer, f'_parse_{kind}_series')
+        df = pd.DataFrame({'col': self.RAW})
+
+        got = importer._column_values(df, {'x': 'col'}, 'x', series_parser)
+
+        expected = [scalar(v) for v in self.RAW]
+        assert got == pytest.approx(expected)
+        assert [type(v) for v in got] == [type(v) for v in expected]
+
+    def test_missing_column_is_all_none(self, importer):
+        df = pd.DataFrame({'col': ['1', '2']})
+        assert importer._column_values(df, {}, 'clicks') == [None, None]
 
 
 class TestLooksLikeHeader:
@@ -134,6 +123,10 @@ class TestLooksLikeHeader:
         cols = ['customer search term', 'impr', 'ctr', 'spend']
         assert importer._looks_like_header(cols) is True
 
+    def test_aliases_of_one_field_count_once(self, importer):
+        cols = ['sales', 'total sales', '7 day total sales']
+        assert importer._looks_like_header(cols) is False
+
 
 class TestMapColumns:
     def test_exact_match(self, importer):
@@ -164,6 +157,17 @@ class TestMapColumns:
         assert 'search_term' in result
         assert 'impressions' in result
 
+    def test_earlier_alias_wins_over_later(self, importer):
+        # 'total sales' is listed before 'sales', whatever the column order
+        cols = ['sales', 'search term', 'total sales']
+        result = importer._map_columns(cols)
+        assert result['sales'] == 'total sales'
+
+    def test_fuzzy_match_for_unlisted_variant(self, importer):
+        cols = ['search term', 'spend (usd)']
+        result = importer._map_columns(cols)
+        assert result['spend'] == 'spend (usd)'
+
 
 class TestColumnAliases:
     def test_all_canonical_names_have_aliases(self):
@@ -180,3 +184,8 @@ class TestColumnAliases:
                 assert alias == alias.lower(), (
                     f'{canonical} alias "{alias}" is not lowercase'
                 )
+
+    def test_reverse_lookup_covers_every_alias(self):
+        for canonical, aliases in COLUMN_ALIASES.items():
+            for alias in aliases:
+                assert ALIAS_TO_CANONICAL[alias] == canonical
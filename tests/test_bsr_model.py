@@ -1,6 +1,7 @@
 """Tests for BSR-to-sales estimation model."""
 
 import pytest
+from kdp_scout.collectors import bsr_model
 from kdp_scout.collectors.bsr_model import (
     estimate_daily_sales,
     estimate_monthly_revenue,
@@ -173,3 +174,55 @@ class TestSalesVelocityLabel:
         assert sales_velocity_label(3) == 'Moderate'
         assert sales_velocity_label(0.5) == 'Low'
         assert sales_velocity_label(0.49) == 'Minimal'
+
+
+class TestEstimateDailySalesCache:
+    def test_repeat_calls_hit_cache(self):
+        bsr_model._estimate_daily_sales_cached.cache_clear()
+        first = estimate_daily_sales(4321)
+        assert estimate_daily_sales(4321) == first
+        info = bsr_model._estimate_daily_sales_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_float_bsr_not_truncated(self):
+        assert estimate_daily_sales(1000.9) < estimate_daily_sales(1000)
+
+    def test_invalid_input_skips_cache(self):
+        bsr_model._estimate_daily_sales_cached.cache_clear()
+        assert estimate_daily_sales(None) == 0.0
+        assert estimate_daily_sales(0) == 0.0
+        assert bsr_model._estimate_daily_sales_cached.cache_info().currsize == 0
+
+
+class TestEstimateDailySalesArray:
+    @pytest.mark.parametrize('marketplace', list(MODELS) + ['unknown'])
+    def test_matches_scalar(self, marketplace):
+        bsrs = [1, 7, 100, 1000, 12345, 100000, 500000, 2_000_000]
+        result = bsr_model.estimate_daily_sales_array(bsrs, marketplace)
+        assert result.tolist() == pytest.approx(
+            [estimate_daily_sales(b, marketplace) for b in bsrs], abs=0.01,
+        )
+
+    def test_invalid_entries_are_zero(self):
+        result = bsr_model.estimate_daily_sales_array([None, 0, -5, 100])
+        assert result[:3].tolist() == [0.0, 0.0, 0.0]
+        assert result[3] > 0
+
+    def test_empty(self):
+        assert bsr_model.estimate_daily_sales_array([]).tolist() == []
+
+
+class TestSalesVelocityLabels:
+    def test_matches_scalar(self):
+        values = [-1, 0, 0.49, 0.5, 2.99, 3, 9.99, 10, 49.99, 50, 1000,
+                  float('nan'), float('inf'), float('-inf')]
+        assert bsr_model.sales_velocity_labels(values).tolist() == [
+            sales_velocity_label(v) for v in values
+        ]
+
+    def test_nan_is_minimal(self):
+        nan = float('nan')
+        assert sales_velocity_label(nan) == 'Minimal'
+        assert bsr_model.sales_velocity_labels([nan, 0.0]).tolist() == [
+            'Minimal', 'Minimal',
+        ]
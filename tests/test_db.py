@@ -0,0 +1,136 @@
+"""Tests for database repository queries."""
+
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+from kdp_scout.db import (
+    SCHEMA_SQL, KeywordRepository, _migrate_add_score_column,
+)
+
+
+@pytest.fixture
+def kw_repo():
+    """KeywordRepository on an in-memory database with the base schema."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA_SQL)
+    repo = KeywordRepository(conn=conn)
+    yield repo
+    conn.close()
+
+
+def _add_snapshot(repo, keyword_id, days_ago, position):
+    snapshot = (date.today() - timedelta(days=days_ago)).isoformat()
+    repo._conn.execute(
+        'INSERT INTO keyword_metrics '
+        '(keyword_id, snapshot_date, autocomplete_position) VALUES (?, ?, ?)',
+        (keyword_id, snapshot, position),
+    )
+
+
+class TestKeywordMetricsHistories:
+    def test_matches_single_keyword_history(self, kw_repo):
+        ids = [kw_repo.upsert_keyword(f'kw {i}')[0] for i in range(3)]
+        for days_ago in (40, 10, 5, 0):
+            _add_snapshot(kw_repo, ids[0], days_ago, days_ago + 1)
+        _add_snapshot(kw_repo, ids[1], 3, 7)
+
+        histories = kw_repo.get_keyword_metrics_histories(ids, days=30)
+
+        for keyword_id in ids[:2]:
+            expected = kw_repo.get_keyword_metrics_history(keyword_id, days=30)
+            assert ([tuple(r) for r in histories[keyword_id]]
+                    == [tuple(r) for r in expected])
+        assert ids[2] not in histories
+        assert len(histories[ids[0]]) == 3
+
+    def test_chunks_large_id_lists(self, kw_repo, monkeypatch):
+        monkeypatch.setattr('kdp_scout.db._MAX_IN_PARAMS', 2)
+        ids = [kw_repo.upsert_keyword(f'kw {i}')[0] for i in range(5)]
+        for keyword_id in ids:
+            _add_snapshot(kw_repo, keyword_id, 1, keyword_id)
+
+        histories = kw_repo.get_keyword_metrics_histories(ids)
+
+        assert sorted(histories) == ids
+
+    def test_empty_ids(self, kw_repo):
+        assert kw_repo.get_keyword_metrics_histories([]) == {}
+
+
+def _add_search_term(repo, term, impressions, clicks, orders, spend, sales):
+    repo._conn.execute(
+        'INSERT INTO ads_search_terms '
+        '(search_term, impressions, clicks, orders, spend, sales, '
+        'report_date, imported_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (term, impressions, clicks, orders, spend, sales,
+         '2025-01-01', '2025-01-02'),
+    )
+
+
+def _add_ranking(repo, keyword_id, asin, position, is_own):
+    book_id = repo._conn.execute(
+        'INSERT INTO books (asin, is_own, added_date) VALUES (?, ?, ?)',
+        (asin, int(is_own), '2025-01-01'),
+    ).lastrowid
+    repo._conn.execute(
+        'INSERT INTO keyword_rankings '
+        '(keyword_id, book_id, snapshot_date, rank_position) '
+        'VALUES (?, ?, ?, ?)',
+        (keyword_id, book_id, '2025-01-01', position),
+    )
+
+
+class TestScoringRows:
+    @pytest.fixture
+    def kw_repo(self, kw_repo):
+        """Both row queries read keywords.score, which a migration adds."""
+        _migrate_add_score_column(kw_repo._conn)
+        return kw_repo
+
+    def test_matches_per_keyword_lookups(self, kw_repo):
+        ids = [kw_repo.upsert_keyword(kw)[0]
+               for kw in ('dark fantasy', 'Cozy Mystery', 'no data')]
+        _add_snapshot(kw_repo, ids[0], 5, 9)
+        _add_snapshot(kw_repo, ids[0], 1, 3)
+        _add_search_term(kw_repo, 'dark fantasy', 1000, 20, 4, 10.0, 40.0)
+        _add_search_term(kw_repo, 'DARK FANTASY', 500, 5, 1, 5.0, 10.0)
+        _add_search_term(kw_repo, 'cozy mystery', 200, 2, 0, 3.0, 0.0)
+        _add_ranking(kw_repo, ids[0], 'B0OWN00001', 7, is_own=True)
+        _add_ranking(kw_repo, ids[0], 'B0OWN00002', 4, is_own=True)
+        _add_ranking(kw_repo, ids[1], 'B0COMP0001', 1, is_own=False)
+
+        rows = kw_repo.get_scoring_rows(ids + [999])
+
+        assert sorted(rows) == ids
+        for keyword_id in ids:
+            row = rows[keyword_id]
+            single = kw_repo.get_keyword_with_metrics(keyword_id)
+            assert {k: row[k] for k in single.keys()} == dict(single)
+
+            ads = kw_repo.get_ads_data_for_keyword(row['keyword'])
+            assert row['ads_impressions'] == (ads and ads['impressions'])
+            assert row['ads_clicks'] == (ads and ads['clicks'])
+            assert row['ads_orders'] == (ads and ads['orders'])
+            assert row['acos'] == kw_repo.get_ads_acos_for_keyword(
+                row['keyword'])
+            assert row['own_rank'] == kw_repo.get_own_ranking_for_keyword(
+                keyword_id)
+
+        assert rows[ids[0]]['autocomplete_position'] == 3
+        assert rows[ids[0]]['ads_impressions'] == 1500
+        assert rows[ids[0]]['acos'] == pytest.approx(0.3)
+        assert rows[ids[0]]['own_rank'] == 4
+        assert rows[ids[1]]['acos'] is None
+        assert rows[ids[1]]['own_rank'] is None
+        assert rows[ids[2]]['ads_impressions'] is None
+
+    def test_chunks_large_id_lists(self, kw_repo, monkeypatch):
+        monkeypatch.setattr('kdp_scout.db._MAX_IN_PARAMS', 2)
+        ids = [kw_repo.upsert_keyword(f'kw {i}')[0] for i in range(5)]
+
+        assert sorted(kw_repo.get_scoring_rows(ids)) == ids
+
+    def test_empty_ids(self, kw_repo):
+        assert kw_repo.get_scoring_rows([]) == {}
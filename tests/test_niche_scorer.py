@@ -98,6 +98,51 @@ class TestComputeOpportunityScore:
 
         assert all_underserved > no_underserved
 
+    @pytest.mark.parametrize('metric,value,expected', [
+        # BSR tiers: >= bound, 40 points
+        ('avg_bsr', 9_999, 4.0),
+        ('avg_bsr', 10_000, 8.0),
+        ('avg_bsr', 19_999, 8.0),
+        ('avg_bsr', 20_000, 16.0),
+        ('avg_bsr', 49_999, 16.0),
+        ('avg_bsr', 50_000, 24.0),
+        ('avg_bsr', 99_999, 24.0),
+        ('avg_bsr', 100_000, 32.0),
+        ('avg_bsr', 199_999, 32.0),
+        ('avg_bsr', 200_000, 40.0),
+        ('avg_bsr', float('nan'), 4.0),
+        # Review tiers: < bound, 30 points
+        ('avg_reviews', 0, 30.0),
+        ('avg_reviews', 19, 30.0),
+        ('avg_reviews', 20, 24.0),
+        ('avg_reviews', 49, 24.0),
+        ('avg_reviews', 50, 18.0),
+        ('avg_reviews', 99, 18.0),
+        ('avg_reviews', 100, 12.0),
+        ('avg_reviews', 249, 12.0),
+        ('avg_reviews', 250, 6.0),
+        ('avg_reviews', 499, 6.0),
+        ('avg_reviews', 500, 3.0),
+        ('avg_reviews', float('nan'), 3.0),
+        # Demand tiers: >= bound, 20 points; no revenue scores nothing
+        ('avg_monthly_revenue', -1, 0.0),
+        ('avg_monthly_revenue', 0, 0.0),
+        ('avg_monthly_revenue', 0.01, 4.0),
+        ('avg_monthly_revenue', 9, 4.0),
+        ('avg_monthly_revenue', 10, 8.0),
+        ('avg_monthly_revenue', 49, 8.0),
+        ('avg_monthly_revenue', 50, 12.0),
+        ('avg_monthly_revenue', 199, 12.0),
+        ('avg_monthly_revenue', 200, 16.0),
+        ('avg_monthly_revenue', 499, 16.0),
+        ('avg_monthly_revenue', 500, 20.0),
+        ('avg_monthly_revenue', float('nan'), 0.0),
+    ])
+    def test_tier_bounds(self, metric, value, expected):
+        """Each tier bound, and one below it, lands in the right tier."""
+        score = _compute_opportunity_score({metric: value}, result_count=0)
+        assert score == expected
+
 
 class TestGenerateRecommendation:
     """Tests for _generate_recommendation."""
@@ -1,7 +1,15 @@
 """Tests for reporting utility functions and algorithms."""
 
+import io
+import json
+
 import pytest
-from kdp_scout.reporting import _fmt_number, _fmt_price, _score_to_bid, BID_TIERS
+from unittest.mock import patch
+
+from kdp_scout import reporting
+from kdp_scout.reporting import (
+    ReportingEngine, _fmt_number, _fmt_price, _score_to_bid, BID_TIERS,
+)
 
 
 class TestFmtNumber:
@@ -37,6 +45,21 @@ class TestFmtPrice:
     def test_small_price(self):
         assert _fmt_price(0.99) == '$0.99'
 
+    def test_rounds_to_cents(self):
+        assert _fmt_price(4.999) == '$5.00'
+        assert _fmt_price(0.004) == '$0.00'
+
+    def test_negative_price(self):
+        assert _fmt_price(-12.5) == '$-12.50'
+
+    def test_non_finite_price(self):
+        assert _fmt_price(float('nan')) == '$nan'
+        assert _fmt_price(float('inf')) == '$inf'
+
+    @pytest.mark.parametrize('value', [0.005, 0.015, 1.005, 2.675, 0.125, 1e15])
+    def test_matches_float_formatting(self, value):
+        assert _fmt_price(value) == f'${value:,.2f}'
+
 
 class TestScoreToBid:
     def test_score_100_plus(self):
@@ -63,6 +86,10 @@ class TestScoreToBid:
         """Negative scores should still return the minimum bid."""
         assert _score_to_bid(-10) == 0.35
 
+    def test_nan_score(self):
+        """A NaN score gets the minimum bid, not the top tier."""
+        assert _score_to_bid(float('nan')) == 0.35
+
     def test_bid_tiers_are_descending(self):
         """BID_TIERS should be ordered from highest to lowest threshold."""
         thresholds = [t for t, _ in BID_TIERS]
@@ -72,3 +99,323 @@ class TestScoreToBid:
         """Higher thresholds should map to higher bids."""
         bids = [b for _, b in BID_TIERS]
         assert bids == sorted(bids, reverse=True)
+
+
+class TestScoresToBids:
+    def test_matches_scalar_version(self):
+        scores = [
+            -10, 0, 24, 24.9, 25, 49, 50, 74.5, 75, 99, 100, 200,
+            float('nan'), float('inf'), float('-inf'),
+        ]
+        assert reporting._scores_to_bids(scores) == [
+            _score_to_bid(s) for s in scores
+        ]
+
+    def test_empty(self):
+        assert reporting._scores_to_bids([]) == []
+
+
+class TestReportingEngineLazyRepos:
+    @patch('kdp_scout.reporting.init_db')
+    def test_init_db_runs_once_per_path(self, mock_init_db, monkeypatch):
+        monkeypatch.setattr(reporting, '_INITIALIZED', set())
+        ReportingEngine()
+        ReportingEngine()
+        assert mock_init_db.call_count == 1
+
+    @patch('kdp_scout.reporting.BookRepository')
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_repos_created_on_first_access(self, mock_init_db, mock_kw_repo,
+                                            mock_book_repo):
+        engine = ReportingEngine()
+        mock_kw_repo.assert_not_called()
+
+        assert engine._book_repo is engine._book_repo
+        mock_book_repo.assert_called_once()
+        mock_kw_repo.assert_not_called()
+
+    @patch('kdp_scout.reporting.BookRepository')
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_close_only_closes_opened_repos(self, mock_init_db, mock_kw_repo,
+                                             mock_book_repo):
+        engine = ReportingEngine()
+        engine._book_repo
+        engine.close()
+
+        mock_book_repo.return_value.close.assert_called_once()
+        mock_kw_repo.return_value.close.assert_not_called()
+
+
+class TestWritePlainTable:
+    def test_aligns_columns(self, monkeypatch):
+        buf = io.StringIO()
+        monkeypatch.setattr(reporting.console, 'file', buf)
+        reporting._write_plain_table(
+            ('#', 'Keyword'),
+            [('1', 'a'), ('10', 'longer keyword')],
+            (True, False),
+        )
+        lines = buf.getvalue().splitlines()
+        assert lines[0] == ' #  Keyword'
+        assert lines[2] == ' 1  a'
+        assert lines[3] == '10  longer keyword'
+
+
+class TestDisplayTitle:
+    def test_title_and_author_on_one_line(self):
+        assert (reporting._display_title('The Key', 'Jane Doe', 0)
+                == 'The Key — Jane Doe')
+
+    def test_missing_title_and_author(self):
+        assert reporting._display_title(None, None, 0) == 'Unknown'
+
+    def test_own_book_is_bold(self):
+        assert reporting._display_title('Mine', '', 1) == '[bold]Mine[/bold]'
+
+
+class TestTableFactories:
+    def test_keyword_table_columns(self):
+        table = reporting._new_keyword_table()
+        headers = [c.header for c in table.columns]
+        assert headers == [h for h, _ in reporting._KEYWORD_COLUMNS]
+        assert table.row_count == 0
+
+    def test_competitor_title_does_not_wrap(self):
+        table = reporting._new_competitor_table()
+        title_col = table.columns[1]
+        assert title_col.no_wrap is True
+        assert title_col.overflow == 'ellipsis'
+
+
+class TestPrintBuffered:
+    def test_single_write(self, monkeypatch):
+        buf = io.StringIO()
+        writes = []
+        monkeypatch.setattr(reporting.console, 'file', buf)
+        monkeypatch.setattr(buf, 'write', lambda text: writes.append(text))
+        table = reporting._new_keyword_table()
+        table.add_row('1', 'kw', '50', '-', '-', '-', '-', 'autocomplete')
+        reporting._print_buffered(table, '[dim]footer[/dim]')
+        assert len(writes) == 1
+        assert 'kw' in writes[0]
+        assert 'footer' in writes[0]
+
+
+class TestBulkAddRows:
+    def _render(self, table):
+        from rich.console import Console
+        buf = io.StringIO()
+        Console(file=buf, width=100, color_system=None).print(table)
+        return buf.getvalue()
+
+    def test_matches_add_row(self):
+        rows = [
+            ('B01', 'First', '1,000', '$2.99', '10', '4.5', '3.0', '$90.00'),
+            ('B02', 'Second', None, '-', '-', '-', '-', '-'),
+        ]
+        styles = ['bold green', '']
+
+        expected = reporting._new_competitor_table()
+        for row, style in zip(rows, styles):
+            expected.add_row(*row, style=style)
+
+        actual = reporting._new_competitor_table()
+        reporting._bulk_add_rows(actual, rows, styles)
+
+        assert actual.row_count == 2
+        assert self._render(actual) == self._render(expected)
+
+
+class TestKeywordSummaryExports:
+    KEYWORDS = [
+        {'keyword': 'dark fantasy', 'score': 80, 'autocomplete_position': 2,
+         'impressions': 1200, 'clicks': 30, 'orders': 3,
+         'source': 'autocomplete'},
+        {'keyword': 'grimdark', 'score': None, 'autocomplete_position': None,
+         'impressions': None, 'clicks': None, 'orders': None, 'source': None},
+    ]
+
+    def test_csv(self, capsys):
+        engine = ReportingEngine.__new__(ReportingEngine)
+        engine._keyword_summary_csv(self.KEYWORDS)
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith('Rank,Keyword,Score')
+        assert lines[1] == '1,dark fantasy,80,2,1200,30,3,autocomplete'
+        assert lines[2] == '2,grimdark,0,,,,,'
+
+    def test_json(self, capsys):
+        engine = ReportingEngine.__new__(ReportingEngine)
+        engine._keyword_summary_json(self.KEYWORDS)
+        data = json.loads(capsys.readouterr().out)
+        assert [d['rank'] for d in data] == [1, 2]
+        assert data[1]['score'] == 0
+
+    def test_json_compact_when_piped(self, capsys):
+        engine = ReportingEngine.__new__(ReportingEngine)
+        engine._keyword_summary_json(self.KEYWORDS)
+        out = capsys.readouterr().out
+        assert out.count('\n') == 1
+        assert '"rank":1,' in out
+
+
+class TestUtf8Len:
+    @pytest.mark.parametrize('text', ['', 'dark fantasy', 'café noir', '日本語'])
+    def test_matches_encoded_length(self, text):
+        assert reporting._utf8_len(text) == len(text.encode('utf-8'))
+
+
+class TestPackBackendKeywords:
+    def test_skips_already_used_words(self):
+        slots, used, total = reporting._pack_backend_keywords([
+            ('Dark Fantasy', 80), ('dark magic', 60), ('fantasy', 50),
+        ])
+        packed = [phrase for slot in slots for phrase in slot]
+        assert packed == ['dark fantasy', 'magic']
+        assert used == {'dark', 'fantasy', 'magic'}
+        assert total == 140
+
+    def test_slots_within_byte_limit(self):
+        keywords = [(f'word{i} other{i} extra{i}', 100 - i) for i in range(60)]
+        slots, _, _ = reporting._pack_backend_keywords(keywords)
+        assert len(slots) == reporting.KDP_SLOT_COUNT
+        for slot in slots:
+            assert len(' '.join(slot).encode('utf-8')) <= reporting.KDP_SLOT_MAX_BYTES
+
+    def test_best_fit_prefers_fullest_slot(self):
+        # 'a' * 45 leaves 5 bytes in slot 1; 'b' * 40 goes to slot 2 (10 left);
+        # 'cccc' (4 + 1 separator) fits exactly in slot 1, not slot 2
+        slots, _, _ = reporting._pack_backend_keywords([
+            ('a' * 45, 3), ('b' * 40, 2), ('cccc', 1),
+        ])
+        assert slots[0] == ['a' * 45, 'cccc']
+        assert slots[1] == ['b' * 40]
+
+
+class TestCachedKeywords:
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_same_args_query_once(self, mock_init_db, mock_kw_repo):
+        repo = mock_kw_repo.return_value
+        repo.get_keywords_with_latest_metrics.return_value = [{'id': 1}]
+        engine = ReportingEngine()
+
+        first = engine._cached_keywords(limit=200, min_score=0, order_by='score')
+        second = engine._cached_keywords(limit=200, min_score=0, order_by='score')
+        engine._cached_keywords(limit=100, min_score=0, order_by='score')
+
+        assert first is second
+        assert repo.get_keywords_with_latest_metrics.call_count == 2
+
+
+class TestColorBuckets:
+    @pytest.mark.parametrize('score, style', [
+        (0, ''), (9.9, ''), (10, 'dim'), (25, 'yellow'), (50, 'green'),
+        (75, 'bold green'), (100, 'bold green'),
+    ])
+    def test_score_styles(self, score, style):
+        idx = reporting.bisect_right(reporting._SCORE_THRESHOLDS, score)
+        assert str(reporting._SCORE_STYLES[idx]) == (style or 'none')
+
+    @pytest.mark.parametrize('acos_pct, style', [
+        (10, 'green'), (50, 'green'), (50.5, 'yellow'), (100, 'yellow'),
+        (100.5, 'red'), (300, 'red'),
+    ])
+    def test_acos_styles(self, acos_pct, style):
+        idx = reporting.bisect_left(reporting._ACOS_THRESHOLDS, acos_pct)
+        assert str(reporting._ACOS_STYLES[idx]) == style
+
+
+class TestExportForAds:
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_streams_in_batches(self, mock_init_db, mock_kw_repo, capsys,
+                                monkeypatch):
+        monkeypatch.setattr(reporting, 'EXPORT_BATCH_SIZE', 2)
+        rows = [{'keyword': f'kw {i}', 'score': s}
+                for i, s in enumerate([90, 60, 30, 5, None])]
+        batches = [rows[0:2], rows[2:4], rows[4:5], []]
+        cursor = mock_kw_repo.return_value.iter_keywords_with_latest_metrics.return_value
+        cursor.fetchmany.side_effect = batches
+
+        content = ReportingEngine().export_for_ads()
+
+        assert content == capsys.readouterr().out
+        assert content.splitlines() == [
+            'Keyword,Match Type,Bid',
+            'kw 0,broad,1.00',
+            'kw 1,broad,0.75',
+            'kw 2,broad,0.50',
+            'kw 3,broad,0.35',
+            'kw 4,broad,0.35',
+        ]
+
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_empty_returns_blank(self, mock_init_db, mock_kw_repo):
+        cursor = mock_kw_repo.return_value.iter_keywords_with_latest_metrics.return_value
+        cursor.fetchmany.return_value = []
+        assert ReportingEngine().export_for_ads() == ''
+
+
+class TestKeywordGaps:
+    @patch('kdp_scout.reporting.KeywordRankingRepository')
+    @patch('kdp_scout.reporting.AdsRepository')
+    @patch('kdp_scout.reporting.BookRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_skips_ranking_queries_without_own_books(
+            self, mock_init_db, mock_book_repo, mock_ads_repo,
+            mock_ranking_repo):
+        mock_book_repo.return_value.get_all_books.return_value = [
+            {'id': 1, 'is_own': 0},
+        ]
+        mock_ads_repo.return_value.get_search_term_count.return_value = 0
+        engine = ReportingEngine()
+
+        engine.keyword_gaps()
+
+        mock_ranking_repo.return_value.get_gaps.assert_not_called()
+        assert '_ranking_repo' not in engine.__dict__
+
+    @patch('kdp_scout.reporting.AdsRepository')
+    @patch('kdp_scout.reporting.BookRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_hint_replaces_no_data_message(
+            self, mock_init_db, mock_book_repo, mock_ads_repo, monkeypatch):
+        mock_book_repo.return_value.get_all_books.return_value = [
+            {'id': 1, 'is_own': 0},
+        ]
+        mock_ads_repo.return_value.get_search_term_count.return_value = 0
+        buf = io.StringIO()
+        monkeypatch.setattr(reporting.console, 'file', buf)
+        engine = ReportingEngine()
+
+        engine.keyword_gaps()
+
+        out = buf.getvalue()
+        assert 'Ranking gap analysis needs your own books' in out
+        assert 'No gap analysis data' not in out
+
+    @patch('kdp_scout.reporting.BookRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_book_partition_cached(self, mock_init_db, mock_book_repo):
+        mock_book_repo.return_value.get_all_books.return_value = [
+            {'id': 1, 'is_own': 1}, {'id': 2, 'is_own': 0},
+            {'id': 3, 'is_own': 0},
+        ]
+        engine = ReportingEngine()
+
+        assert engine._partition_books() == ([1], [2, 3])
+        engine._partition_books()
+        assert mock_book_repo.return_value.get_all_books.call_count == 1
+
+
+class TestReportingEngineSlots:
+    @patch('kdp_scout.reporting.KeywordRepository')
+    @patch('kdp_scout.reporting.init_db')
+    def test_caches_in_slots_repos_in_dict(self, mock_init_db, mock_kw_repo):
+        engine = ReportingEngine()
+        engine._kw_repo
+        assert set(engine.__dict__) == {'_kw_repo'}
+        assert engine._kw_cache == {}
@@ -1,11 +1,15 @@
 """Tests for keyword scoring algorithm."""
 
 import math
+import numpy as np
 import pytest
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
+from kdp_scout.db import KeywordRepository
 from kdp_scout.keyword_engine import (
     KeywordScorer,
     DEFAULT_WEIGHTS,
+    SCORE_SIGNALS,
     normalize_autocomplete,
     normalize_competition,
     normalize_bsr,
@@ -19,27 +23,78 @@ from kdp_scout.keyword_engine import (
 )
 
 
+# Metric fields of a keyword row; read-only so no test can change them
+KEYWORD_ROW_DEFAULTS = MappingProxyType({
+    'id': 1,
+    'keyword': 'test keyword',
+    'autocomplete_position': None,
+    'competition_count': None,
+    'avg_bsr_top_results': None,
+    'impressions': None,
+    'clicks': None,
+    'orders': None,
+    'estimated_volume': None,
+    'suggested_bid': None,
+    'source': 'autocomplete',
+    'first_seen': '2025-01-01',
+    'category': None,
+    'score': None,
+    'snapshot_date': '2025-01-01',
+})
+
+
 def make_keyword_row(**overrides):
     """Create a mock keyword row with metric fields."""
-    defaults = {
-        'id': 1,
-        'keyword': 'test keyword',
-        'autocomplete_position': None,
-        'competition_count': None,
-        'avg_bsr_top_results': None,
-        'impressions': None,
-        'clicks': None,
-        'orders': None,
-        'estimated_volume': None,
-        'suggested_bid': None,
-        'source': 'autocomplete',
-        'first_seen': '2025-01-01',
-        'category': None,
-        'score': None,
-        'snapshot_date': '2025-01-01',
-    }
-    defaults.update(overrides)
-    return defaults
+    return KEYWORD_ROW_DEFAULTS | overrides
+
+
+# Extra columns of a get_scoring_rows() row
+SCORING_ROW_EXTRAS = MappingProxyType({
+    'ads_impressions': None,
+    'ads_clicks': None,
+    'ads_orders': None,
+    'acos': None,
+    'own_rank': None,
+})
+
+
+def make_scoring_row(**overrides):
+    """Create a mock get_scoring_rows() row: a keyword row plus the ads
+    and ranking cross-references."""
+    return KEYWORD_ROW_DEFAULTS | SCORING_ROW_EXTRAS | overrides
+
+
+# Rows shared by several tests, built once at import. Scoring only
+# reads rows (the real ones are sqlite3.Row), so they are read-only.
+EMPTY_ROW = MappingProxyType(make_keyword_row())
+ROW_AUTOCOMPLETE_1 = MappingProxyType(make_keyword_row(autocomplete_position=1))
+
+
+class StubRepo:
+    """Stand-in for the KeywordRepository lookups that scoring makes.
+
+    Each lookup returns the matching attribute, so scoring tests set
+    e.g. repo.keyword_row instead of configuring mock return values.
+    """
+
+    def __init__(self, keyword_row=None, ads_data=None, acos=None,
+                 own_rank=None):
+        self.keyword_row = keyword_row
+        self.ads_data = ads_data
+        self.acos = acos
+        self.own_rank = own_rank
+
+    def get_keyword_with_metrics(self, keyword_id):
+        return self.keyword_row
+
+    def get_ads_data_for_keyword(self, keyword):
+        return self.ads_data
+
+    def get_ads_acos_for_keyword(self, keyword):
+        return self.acos
+
+    def get_own_ranking_for_keyword(self, keyword_id):
+        return self.own_rank
 
 
 # ── Normalizer unit tests ────────────────────────────────────────────
@@ -310,53 +365,65 @@ class TestWeights:
 # ── KeywordScorer integration tests ──────────────────────────────────
 
 
+@pytest.fixture(scope='class')
+def class_scorer():
+    """One KeywordScorer with mocked DB access per test class.
+
+    The repo mock is specced, so calling a method KeywordRepository
+    doesn't have fails instead of returning a child mock.
+    """
+    with patch('kdp_scout.keyword_engine.init_db'):
+        with patch('kdp_scout.keyword_engine.KeywordRepository') as mock_repo_cls:
+            mock_repo_cls.return_value = MagicMock(spec=KeywordRepository)
+            return KeywordScorer()
+
+
+@pytest.fixture
+def scorer(class_scorer):
+    """The class's KeywordScorer, with its repo mock reset for this test."""
+    mock_repo = class_scorer._repo
+    mock_repo.reset_mock(return_value=True, side_effect=True)
+    # Default: no ACOS data, no ranking data, no ads data
+    mock_repo.get_ads_acos_for_keyword.return_value = None
+    mock_repo.get_own_ranking_for_keyword.return_value = None
+    mock_repo.get_ads_data_for_keyword.return_value = None
+    return class_scorer
+
+
 class TestScoreKeyword:
     """Tests for the composite scoring via KeywordScorer."""
 
     @pytest.fixture
-    def scorer(self):
-        """Create a KeywordScorer with mocked DB access."""
-        with patch('kdp_scout.keyword_engine.init_db'):
-            with patch('kdp_scout.keyword_engine.KeywordRepository') as mock_repo_cls:
-                mock_repo = MagicMock()
-                mock_repo_cls.return_value = mock_repo
-                s = KeywordScorer()
-                s._repo = mock_repo
-                # Default: no ACOS data, no ranking data, no ads data
-                mock_repo.get_ads_acos_for_keyword.return_value = None
-                mock_repo.get_own_ranking_for_keyword.return_value = None
-                mock_repo.get_ads_data_for_keyword.return_value = None
-                return s
-
-    def test_no_signals_returns_zero(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
-        assert scorer.score_keyword(1) == 0.0
+    def scorer(self, class_scorer):
+        """The class's KeywordScorer on a fresh stub repo."""
+        class_scorer._repo = StubRepo()
+        return class_scorer
 
     def test_nonexistent_keyword_returns_zero(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = None
+        scorer._repo.keyword_row = None
         assert scorer.score_keyword(999) == 0.0
 
     def test_score_keyword_returns_float(self, scorer):
         """Backward compatibility: score_keyword returns a float."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.keyword_row = EMPTY_ROW
         result = scorer.score_keyword(1)
         assert isinstance(result, float)
 
     def test_score_keyword_detailed_returns_dict(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.keyword_row = EMPTY_ROW
         result = scorer.score_keyword_detailed(1)
         assert isinstance(result, dict)
         assert 'total' in result
         assert 'components' in result
 
     def test_detailed_has_all_components(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.keyword_row = EMPTY_ROW
         result = scorer.score_keyword_detailed(1)
         expected_keys = set(DEFAULT_WEIGHTS.keys())
         assert set(result['components'].keys()) == expected_keys
 
     def test_each_component_has_required_fields(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.keyword_row = EMPTY_ROW
         result = scorer.score_keyword_detailed(1)
         for name, comp in result['components'].items():
             assert 'score' in comp, f"Component '{name}' missing 'score'"
@@ -365,15 +432,20 @@ class TestScoreKeyword:
             assert 'raw' in comp, f"Component '{name}' missing 'raw'"
             assert 'description' in comp, f"Component '{name}' missing 'description'"
 
+    def test_scorer_has_no_instance_dict(self, scorer):
+        assert not hasattr(scorer, '__dict__')
+        with pytest.raises(AttributeError):
+            scorer.weights = {}
+
     # -- Score range tests --
 
     def test_score_always_in_range_no_data(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.keyword_row = EMPTY_ROW
         score = scorer.score_keyword(1)
         assert 0.0 <= score <= 100.0
 
     def test_score_always_in_range_all_data(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
+        scorer._repo.keyword_row = make_keyword_row(
             autocomplete_position=1,
             competition_count=100,
             avg_bsr_top_results=10,
@@ -383,86 +455,64 @@ class TestScoreKeyword:
             estimated_volume=100000,
             suggested_bid=5.0,
         )
-        scorer._repo.get_ads_acos_for_keyword.return_value = 0.0
-        scorer._repo.get_own_ranking_for_keyword.return_value = 1
+        scorer._repo.acos = 0.0
+        scorer._repo.own_rank = 1
         score = scorer.score_keyword(1)
         assert 0.0 <= score <= 100.0
 
-    def test_perfect_score_is_90(self, scorer):
-        """All non-semantic signals at maximum should produce 90.
-
-        The remaining 10% is from semantic_relevance which requires
-        separate semantic analysis to populate.
-        """
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=1,
-            competition_count=0,
-            avg_bsr_top_results=1,
-            impressions=100000,
-            clicks=5000,  # 5% CTR
-            orders=1000,
-            estimated_volume=100000,
-            suggested_bid=3.0,
-        )
-        scorer._repo.get_ads_acos_for_keyword.return_value = 0.0
-        scorer._repo.get_own_ranking_for_keyword.return_value = 1
-        score = scorer.score_keyword(1)
-        assert score == pytest.approx(90.0, abs=0.1)
-
-    # -- Autocomplete scoring in context --
-
-    def test_autocomplete_only_position_1(self, scorer):
-        """Position 1 autocomplete with default weight (0.15) = 15 points."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=1,
-        )
-        score = scorer.score_keyword(1)
-        assert score == pytest.approx(15.0, abs=0.1)
-
-    def test_autocomplete_only_position_5(self, scorer):
-        """Position 5 = 0.6 normalized * 0.15 weight * 100 = 9.0."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=5,
-        )
-        score = scorer.score_keyword(1)
-        assert score == pytest.approx(9.0, abs=0.1)
-
-    # -- Combined scoring tests --
-
-    def test_autocomplete_and_orders(self, scorer):
-        """Autocomplete pos 1 (15.0) + 1000 orders (15.0) = 30.0."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=1,
-            orders=1000,
-        )
-        score = scorer.score_keyword(1)
-        assert score == pytest.approx(30.0, abs=0.1)
-
-    def test_with_acos_data(self, scorer):
-        """ACOS cross-reference contributes to score."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=1,
-        )
-        scorer._repo.get_ads_acos_for_keyword.return_value = 0.35  # 35% ACOS
-        score = scorer.score_keyword(1)
-        # 15.0 from autocomplete + 6.5 from ACOS (0.65 * 0.10 * 100)
-        assert score == pytest.approx(21.5, abs=0.1)
-
-    def test_with_own_ranking(self, scorer):
-        """Own ranking cross-reference contributes to score."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=1,
-        )
-        scorer._repo.get_own_ranking_for_keyword.return_value = 1
-        score = scorer.score_keyword(1)
+    # -- Composite scores for known inputs --
+
+    @pytest.mark.parametrize('row,acos,own_rank,expected', [
+        pytest.param(EMPTY_ROW, None, None, 0.0, id='no_signals'),
+        pytest.param(
+            make_keyword_row(
+                autocomplete_position=None, competition_count=None,
+                avg_bsr_top_results=None, impressions=None, clicks=None,
+                orders=None, estimated_volume=None, suggested_bid=None,
+            ),
+            None, None, 0.0, id='all_none',
+        ),
+        # All non-semantic signals at maximum. The remaining 10% is
+        # semantic_relevance, which needs separate semantic analysis.
+        pytest.param(
+            make_keyword_row(
+                autocomplete_position=1, competition_count=0,
+                avg_bsr_top_results=1, impressions=100000,
+                clicks=5000,  # 5% CTR
+                orders=1000, estimated_volume=100000, suggested_bid=3.0,
+            ),
+            0.0, 1, 90.0, id='perfect_is_90',
+        ),
+        # Position 1 with default weight (0.15) = 15 points
+        pytest.param(ROW_AUTOCOMPLETE_1, None, None, 15.0,
+                     id='autocomplete_position_1'),
+        # 0.8 * 0.15 * 100 = 12.0
+        pytest.param(make_keyword_row(autocomplete_position=3),
+                     None, None, 12.0, id='autocomplete_position_3'),
+        # 0.6 * 0.15 * 100 = 9.0
+        pytest.param(make_keyword_row(autocomplete_position=5),
+                     None, None, 9.0, id='autocomplete_position_5'),
+        # Autocomplete pos 1 (15.0) + 1000 orders (15.0)
+        pytest.param(make_keyword_row(autocomplete_position=1, orders=1000),
+                     None, None, 30.0, id='autocomplete_and_orders'),
+        # 15.0 from autocomplete + 6.5 from 35% ACOS (0.65 * 0.10 * 100)
+        pytest.param(ROW_AUTOCOMPLETE_1, 0.35, None, 21.5,
+                     id='with_acos_data'),
         # 15.0 from autocomplete + 5.0 from ranking (1.0 * 0.05 * 100)
-        assert score == pytest.approx(20.0, abs=0.1)
+        pytest.param(ROW_AUTOCOMPLETE_1, None, 1, 20.0,
+                     id='with_own_ranking'),
+    ])
+    def test_score(self, scorer, row, acos, own_rank, expected):
+        scorer._repo.keyword_row = row
+        scorer._repo.acos = acos
+        scorer._repo.own_rank = own_rank
+        assert scorer.score_keyword(1) == expected
 
     # -- Edge cases --
 
     def test_keyword_with_only_ads_data(self, scorer):
         """Keyword with only impressions and orders."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
+        scorer._repo.keyword_row = make_keyword_row(
             impressions=10000,
             orders=50,
             clicks=200,
@@ -471,40 +521,15 @@ class TestScoreKeyword:
         assert score > 0.0
         assert score <= 100.0
 
-    def test_keyword_with_only_autocomplete(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=3,
-        )
-        score = scorer.score_keyword(1)
-        # 0.8 * 0.15 * 100 = 12.0
-        assert score == pytest.approx(12.0, abs=0.1)
-
-    def test_none_values_dont_crash(self, scorer):
-        """All None values should produce 0 score without errors."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
-            autocomplete_position=None,
-            competition_count=None,
-            avg_bsr_top_results=None,
-            impressions=None,
-            clicks=None,
-            orders=None,
-            estimated_volume=None,
-            suggested_bid=None,
-        )
-        scorer._repo.get_ads_acos_for_keyword.return_value = None
-        scorer._repo.get_own_ranking_for_keyword.return_value = None
-        score = scorer.score_keyword(1)
-        assert score == 0.0
-
     def test_empty_result_for_none_keyword(self, scorer):
-        scorer._repo.get_keyword_with_metrics.return_value = None
+        scorer._repo.keyword_row = None
         result = scorer.score_keyword_detailed(999)
         assert result['total'] == 0.0
         assert len(result['components']) == len(DEFAULT_WEIGHTS)
 
     def test_detailed_weighted_sum_equals_total(self, scorer):
         """The sum of all weighted components should equal total."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
+        scorer._repo.keyword_row = make_keyword_row(
             autocomplete_position=3,
             competition_count=25000,
             avg_bsr_top_results=50000,
@@ -514,42 +539,202 @@ class TestScoreKeyword:
             estimated_volume=10000,
             suggested_bid=1.50,
         )
-        scorer._repo.get_ads_acos_for_keyword.return_value = 0.40
-        scorer._repo.get_own_ranking_for_keyword.return_value = 5
+        scorer._repo.acos = 0.40
+        scorer._repo.own_rank = 5
 
         result = scorer.score_keyword_detailed(1)
         computed_sum = sum(c['weighted'] for c in result['components'].values())
         assert result['total'] == pytest.approx(round(computed_sum, 1), abs=0.1)
 
+    def test_score_keyword_matches_detailed_total(self, scorer):
+        """score_keyword skips the breakdown but must agree with it."""
+        scorer._repo.keyword_row = make_keyword_row(
+            autocomplete_position=2,
+            competition_count=120000,
+            avg_bsr_top_results=3500,
+            impressions=800,
+            clicks=7,
+            orders=3,
+            estimated_volume=2500,
+            suggested_bid=0.85,
+        )
+        scorer._repo.acos = 0.65
+        scorer._repo.own_rank = 12
+        assert scorer.score_keyword(1) == scorer.score_keyword_detailed(1)['total']
+
+    def test_batch_scoring_matches_scalar(self, scorer):
+        """score_keywords over stacked rows equals score_keyword per row."""
+        cases = [
+            (EMPTY_ROW, None, None),
+            (ROW_AUTOCOMPLETE_1, None, None),
+            (make_keyword_row(autocomplete_position=5, orders=1000), None, None),
+            (make_keyword_row(autocomplete_position=20, competition_count=0),
+             None, None),
+            (make_keyword_row(autocomplete_position=-1, avg_bsr_top_results=0,
+                              impressions=0, clicks=0, orders=0), None, None),
+            (make_keyword_row(avg_bsr_top_results=5_000_000, suggested_bid=5.0,
+                              estimated_volume=10_000_000), 1.5, 60),
+            (make_keyword_row(impressions=10000, clicks=200, orders=50), 0.3, 1),
+            (make_keyword_row(
+                autocomplete_position=3, competition_count=25000,
+                avg_bsr_top_results=50000, impressions=5000, clicks=100,
+                orders=20, estimated_volume=10000, suggested_bid=1.50,
+            ), 0.40, 5),
+        ]
+        expected = []
+        for row, acos, rank in cases:
+            scorer._repo.keyword_row = row
+            scorer._repo.acos = acos
+            scorer._repo.own_rank = rank
+            expected.append(scorer.score_keyword(1))
+
+        signals = {
+            name: [row.get(name) for row, _, _ in cases]
+            for name in SCORE_SIGNALS
+        }
+        signals['acos'] = [acos for _, acos, _ in cases]
+        signals['own_rank'] = [rank for _, _, rank in cases]
+        assert scorer.score_keywords(signals).tolist() == pytest.approx(
+            expected, abs=0.1,
+        )
 
-class TestScoreAllKeywords:
-    """Tests for batch scoring."""
+
+class TestScoreKeywordsBatch:
+    """score_keywords over many random rows against the per-row path."""
+
+    N_ROWS = 10_000
 
     @pytest.fixture
-    def scorer(self):
-        with patch('kdp_scout.keyword_engine.init_db'):
-            with patch('kdp_scout.keyword_engine.KeywordRepository') as mock_repo_cls:
-                mock_repo = MagicMock()
-                mock_repo_cls.return_value = mock_repo
-                s = KeywordScorer()
-                s._repo = mock_repo
-                mock_repo.get_ads_acos_for_keyword.return_value = None
-                mock_repo.get_own_ranking_for_keyword.return_value = None
-                mock_repo.get_ads_data_for_keyword.return_value = None
-                return s
+    def batch_rows(self):
+        """Random raw signals, about a fifth of each column missing."""
+        rng = np.random.default_rng(0)
+        n = self.N_ROWS
+        columns = {
+            'autocomplete_position': rng.integers(-1, 15, n),
+            'competition_count': rng.integers(-10, 1_000_000, n),
+            'avg_bsr_top_results': rng.uniform(0, 2_000_000, n),
+            'impressions': rng.integers(0, 200_000, n),
+            'clicks': rng.integers(0, 5_000, n),
+            'orders': rng.integers(0, 2_000, n),
+            'estimated_volume': rng.integers(0, 500_000, n),
+            'suggested_bid': rng.uniform(0, 5, n),
+            'acos': rng.uniform(0, 2, n),
+            'own_rank': rng.integers(0, 60, n),
+        }
+        return {
+            name: [None if missing else value
+                   for value, missing in zip(values.tolist(),
+                                             rng.random(n) < 0.2)]
+            for name, values in columns.items()
+        }
+
+    def test_batch_matches_per_row(self, class_scorer, batch_rows):
+        repo = StubRepo()
+        class_scorer._repo = repo
+        per_row = []
+        for i in range(self.N_ROWS):
+            row = {name: values[i] for name, values in batch_rows.items()}
+            repo.keyword_row = make_keyword_row(**row)
+            repo.acos = row['acos']
+            repo.own_rank = row['own_rank']
+            per_row.append(class_scorer.score_keyword(1))
+
+        np.testing.assert_array_equal(
+            class_scorer.score_keywords(batch_rows), per_row,
+        )
+
+
+class TestScoreAllKeywords:
+    """Tests for batch scoring."""
 
     def test_score_all_recalculate(self, scorer):
         scorer._repo.get_all_keyword_ids.return_value = [1, 2, 3]
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.get_scoring_rows.return_value = {
+            keyword_id: make_scoring_row(id=keyword_id)
+            for keyword_id in (1, 2, 3)
+        }
         count = scorer.score_all_keywords(recalculate=True)
         assert count == 3
         assert scorer._repo.update_score.call_count == 3
+        scorer._repo.get_scoring_rows.assert_called_once_with([1, 2, 3])
 
     def test_score_all_new_only(self, scorer):
         scorer._repo.get_unscored_keyword_ids.return_value = [4, 5]
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row()
+        scorer._repo.get_scoring_rows.return_value = {}
         count = scorer.score_all_keywords(recalculate=False)
         assert count == 2
+        scorer._repo.update_score.assert_called_with(5, 0.0)
+
+
+class StubScoringRowsRepo:
+    """Serves the per-keyword lookups and get_scoring_rows from one set of
+    scoring rows, so both scoring paths see the same data."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._by_keyword = {row['keyword']: row for row in rows.values()}
+
+    def get_keyword_with_metrics(self, keyword_id):
+        return self.rows.get(keyword_id)
+
+    def get_ads_data_for_keyword(self, keyword):
+        row = self._by_keyword[keyword]
+        if row['ads_impressions'] is None:
+            return None
+        return {
+            'impressions': row['ads_impressions'],
+            'clicks': row['ads_clicks'],
+            'orders': row['ads_orders'],
+        }
+
+    def get_ads_acos_for_keyword(self, keyword):
+        return self._by_keyword[keyword]['acos']
+
+    def get_own_ranking_for_keyword(self, keyword_id):
+        return self.rows[keyword_id]['own_rank']
+
+    def get_scoring_rows(self, keyword_ids):
+        return {i: self.rows[i] for i in keyword_ids if i in self.rows}
+
+
+class TestScoreKeywordBatch:
+    """score_keyword_batch against score_keyword per ID."""
+
+    def test_matches_per_row(self, class_scorer):
+        rows = {
+            1: make_scoring_row(id=1, keyword='empty'),
+            2: make_scoring_row(
+                id=2, keyword='full', autocomplete_position=2,
+                competition_count=40000, avg_bsr_top_results=12000,
+                impressions=3000, clicks=45, orders=12,
+                estimated_volume=8000, suggested_bid=1.1,
+                acos=0.28, own_rank=3,
+            ),
+            # No ads data in keyword_metrics: falls back to the sums
+            3: make_scoring_row(
+                id=3, keyword='fallback', autocomplete_position=6,
+                ads_impressions=2341, ads_clicks=22, ads_orders=5,
+                acos=0.5,
+            ),
+            # keyword_metrics ads data wins over the sums
+            4: make_scoring_row(
+                id=4, keyword='precedence', impressions=500, clicks=10,
+                orders=2, ads_impressions=9999, ads_clicks=999,
+                ads_orders=99,
+            ),
+            5: make_scoring_row(
+                id=5, keyword='zeros', impressions=0, clicks=0, orders=0,
+                avg_bsr_top_results=900000, own_rank=60,
+            ),
+        }
+        class_scorer._repo = StubScoringRowsRepo(rows)
+        ids = [5, 99, 1, 2, 3, 4]
+
+        expected = [class_scorer.score_keyword(i) for i in ids]
+
+        assert class_scorer.score_keyword_batch(ids) == expected
+        assert expected[1] == 0.0  # unknown ID
+        assert all(score > 0 for score in expected[3:])
 
 
 class TestCustomWeights:
@@ -570,19 +755,14 @@ class TestCustomWeights:
             'own_ranking': 0.0,
         }
         with patch('kdp_scout.keyword_engine.init_db'):
-            with patch('kdp_scout.keyword_engine.KeywordRepository') as mock_repo_cls:
-                mock_repo = MagicMock()
-                mock_repo_cls.return_value = mock_repo
+            with patch('kdp_scout.keyword_engine.KeywordRepository'):
                 s = KeywordScorer(weights=custom_weights)
-                s._repo = mock_repo
-                mock_repo.get_ads_acos_for_keyword.return_value = None
-                mock_repo.get_own_ranking_for_keyword.return_value = None
-                mock_repo.get_ads_data_for_keyword.return_value = None
-                return s
+        s._repo = StubRepo()
+        return s
 
     def test_autocomplete_only_weight(self, scorer):
         """With all weight on autocomplete, pos 1 = 100."""
-        scorer._repo.get_keyword_with_metrics.return_value = make_keyword_row(
+        scorer._repo.keyword_row = make_keyword_row(
             autocomplete_position=1,
             competition_count=100,
         )
@@ -597,20 +777,6 @@ class TestAdsDataFallback:
     """Tests for falling back to ads_search_terms when keyword_metrics
     lacks impressions/clicks/orders."""
 
-    @pytest.fixture
-    def scorer(self):
-        """Create a KeywordScorer with mocked DB access."""
-        with patch('kdp_scout.keyword_engine.init_db'):
-            with patch('kdp_scout.keyword_engine.KeywordRepository') as mock_repo_cls:
-                mock_repo = MagicMock()
-                mock_repo_cls.return_value = mock_repo
-                s = KeywordScorer()
-                s._repo = mock_repo
-                mock_repo.get_ads_acos_for_keyword.return_value = None
-                mock_repo.get_own_ranking_for_keyword.return_value = None
-                mock_repo.get_ads_data_for_keyword.return_value = None
-                return s
-
     def test_fallback_to_ads_search_terms(self, scorer):
         """Ads data from ads_search_terms is used when keyword_metrics
         lacks impressions/clicks/orders."""
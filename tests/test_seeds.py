@@ -0,0 +1,226 @@
+"""Tests for the persistent seed keyword manager."""
+
+import json
+import sys
+
+import pytest
+from kdp_scout import seeds
+from kdp_scout.seeds import SeedManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """SeedManager backed by a seeds file in a temp directory."""
+    return SeedManager(seeds_file=tmp_path / 'seeds.json')
+
+
+class TestSeedIndex:
+    def test_add_then_update_is_case_insensitive(self, manager):
+        assert manager.add_seed('Dark Fantasy') is True
+        assert manager.add_seed('  dark fantasy ', department='books') is False
+        assert len(manager) == 1
+        assert manager.list_seeds()[0]['department'] == 'books'
+
+    def test_remove(self, manager):
+        manager.add_seed('grimdark')
+        manager.add_seed('epic fantasy')
+        assert manager.remove_seed('GRIMDARK') is True
+        assert manager.remove_seed('grimdark') is False
+        assert [s['keyword'] for s in manager.list_seeds()] == ['epic fantasy']
+        assert manager.add_seed('grimdark') is True
+
+    def test_mark_mined(self, manager):
+        manager.add_seed('grimdark')
+        manager.mark_mined('Grimdark')
+        manager.mark_mined('grimdark')
+        manager.mark_mined('unknown')
+        seed = manager.list_seeds()[0]
+        assert seed['mine_count'] == 2
+        assert seed['last_mined'] is not None
+
+    def test_index_rebuilt_on_load(self, manager):
+        manager.add_seed('grimdark')
+        reloaded = SeedManager(seeds_file=manager.seeds_file)
+        assert reloaded.add_seed('grimdark') is False
+        reloaded.mark_mined('grimdark')
+        assert reloaded.list_seeds()[0]['mine_count'] == 1
+
+
+class TestSeedBatch:
+    def test_batch_writes_once(self, manager, monkeypatch):
+        writes = []
+        save_now = manager._save_now
+        monkeypatch.setattr(
+            manager, '_save_now', lambda: (writes.append(1), save_now()),
+        )
+
+        with manager.batch():
+            for keyword in ('a', 'b', 'c'):
+                manager.add_seed(keyword)
+            with manager.batch():
+                manager.mark_mined('a')
+            assert writes == []
+
+        assert writes == [1]
+        assert len(SeedManager(seeds_file=manager.seeds_file)) == 3
+
+    def test_unchanged_batch_does_not_write(self, manager):
+        with manager.batch():
+            manager.mark_mined('missing')
+        assert not manager.seeds_file.exists()
+
+    def test_batch_saves_on_error(self, manager):
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_seed('grimdark')
+                raise RuntimeError('interrupted')
+        assert len(SeedManager(seeds_file=manager.seeds_file)) == 1
+
+
+class TestSeedSerialization:
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_round_trip(self, manager, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(seeds, 'orjson', None)
+        manager.add_seeds(['café noir', 'grimdark'])
+        lines = manager.seeds_file.read_text(encoding='utf-8').splitlines()
+        assert json.loads(lines[0])['version'] == 2
+        assert [json.loads(line)['keyword'] for line in lines[1:]] == [
+            'café noir', 'grimdark',
+        ]
+        assert SeedManager(seeds_file=manager.seeds_file).list_seeds() == (
+            manager.list_seeds()
+        )
+
+    def test_pretty_writes_legacy_document(self, tmp_path):
+        path = tmp_path / 'seeds.json'
+        pretty = SeedManager(seeds_file=path, pretty=True)
+        pretty.add_seed('grimdark')
+        data = json.loads(path.read_text())
+        assert data['version'] == 1
+        assert data['seeds'][0]['keyword'] == 'grimdark'
+        assert SeedManager(seeds_file=path).list_seeds() == pretty.list_seeds()
+
+    def test_loads_compact_legacy_document(self, tmp_path):
+        path = tmp_path / 'seeds.json'
+        path.write_text(json.dumps({'seeds': [{'keyword': 'a'}], 'version': 1}))
+        assert SeedManager(seeds_file=path).get_seeds_for_mining() == [
+            ('a', 'kindle'),
+        ]
+
+    def test_corrupt_file_loads_empty(self, tmp_path):
+        path = tmp_path / 'seeds.json'
+        path.write_text('{not json')
+        assert len(SeedManager(seeds_file=path)) == 0
+
+
+class TestSeedLazyLoad:
+    def test_no_read_until_accessed(self, manager, monkeypatch):
+        manager.add_seed('grimdark')
+        loads = []
+        load = SeedManager.load
+        monkeypatch.setattr(
+            SeedManager, 'load', lambda self: (loads.append(1), load(self)),
+        )
+
+        fresh = SeedManager(seeds_file=manager.seeds_file)
+        assert loads == []
+        len(fresh)
+        fresh.list_seeds()
+        assert loads == [1]
+
+
+class TestSeedAtomicSave:
+    def test_no_temp_file_left(self, manager):
+        manager.add_seed('grimdark')
+        assert [p.name for p in manager.seeds_file.parent.iterdir()] == [
+            'seeds.json',
+        ]
+
+    def test_failed_write_keeps_old_file(self, manager, monkeypatch):
+        manager.add_seed('grimdark')
+        before = manager.seeds_file.read_bytes()
+
+        def fail(src, dst):
+            raise OSError('disk full')
+        monkeypatch.setattr(seeds.os, 'replace', fail)
+
+        with pytest.raises(OSError):
+            manager.add_seed('epic fantasy')
+        assert manager.seeds_file.read_bytes() == before
+        assert not manager.seeds_file.with_name('seeds.json.tmp').exists()
+
+
+class TestAddSeeds:
+    def test_bulk_add_shares_timestamp(self, manager):
+        manager.add_seed('grimdark')
+        added = manager.add_seeds(['Epic Fantasy', 'grimdark', '', 'cozy'])
+        assert added == 2
+        seeds_by_kw = {s['keyword']: s for s in manager.list_seeds()}
+        assert set(seeds_by_kw) == {'grimdark', 'epic fantasy', 'cozy'}
+        stamps = {s['last_added'] for s in seeds_by_kw.values()}
+        assert len(stamps) == 1
+        assert seeds_by_kw['cozy']['added_at'] == seeds_by_kw['cozy']['last_added']
+        assert len(SeedManager(seeds_file=manager.seeds_file)) == 3
+
+
+class TestSeedColumns:
+    def test_remove_middle_keeps_index_in_step(self, manager):
+        manager.add_seeds(['a', 'b', 'c', 'd'])
+        manager.remove_seed('b')
+        manager.mark_mined('d')
+        manager.add_seed('c', department='books')
+        seeds_by_kw = {s['keyword']: s for s in manager.list_seeds()}
+        assert list(seeds_by_kw) == ['a', 'c', 'd']
+        assert seeds_by_kw['d']['mine_count'] == 1
+        assert seeds_by_kw['c']['department'] == 'books'
+
+    def test_seeds_for_mining_filters_by_department(self, manager):
+        manager.add_seed('a')
+        manager.add_seed('b', department='books')
+        assert manager.get_seeds_for_mining() == [
+            ('a', 'kindle'), ('b', 'books'),
+        ]
+        assert manager.get_seeds_for_mining('books') == [('b', 'books')]
+
+    def test_old_records_get_defaults_and_dedupe(self, tmp_path):
+        path = tmp_path / 'seeds.json'
+        path.write_text(json.dumps({'seeds': [
+            {'keyword': 'a', 'department': 'books'},
+            {'keyword': 'a', 'department': 'kindle'},
+        ]}))
+        seeds_list = SeedManager(seeds_file=path).list_seeds()
+        assert len(seeds_list) == 1
+        assert seeds_list[0]['department'] == 'books'
+        assert seeds_list[0]['mine_count'] == 0
+
+    def test_keywords_interned(self, manager):
+        manager.add_seed('  Grimdark ')
+        reloaded = SeedManager(seeds_file=manager.seeds_file)
+        assert reloaded.list_seeds()[0]['keyword'] is sys.intern('grimdark')
+
+
+class TestSeedLoadCache:
+    def test_unchanged_file_parsed_once(self, manager, monkeypatch):
+        manager.add_seeds(['a', 'b'])
+        parses = []
+        parse = SeedManager._parse
+        monkeypatch.setattr(
+            SeedManager, '_parse',
+            staticmethod(lambda f: (parses.append(1), parse(f))[1]),
+        )
+
+        first = SeedManager(seeds_file=manager.seeds_file)
+        second = SeedManager(seeds_file=manager.seeds_file)
+        assert len(first) == len(second) == 2
+        assert parses == [1]
+
+        # Changes through one manager don't leak into the other's rows,
+        # and a save makes the next load parse again
+        first.mark_mined('a')
+        assert second.list_seeds()[0]['mine_count'] == 0
+        third = SeedManager(seeds_file=manager.seeds_file)
+        assert third.list_seeds()[0]['mine_count'] == 1
+        assert parses == [1, 1]